@@ -0,0 +1,63 @@
+from typepigeon import to_type
+
+SIZES = [10, 1000, 10000]
+
+
+class CRSConversions:
+    params = [[4326, "EPSG:32618", "+proj=utm +zone=18 +datum=WGS84"]]
+    param_names = ["value"]
+
+    def setup(self, value):
+        try:
+            from pyproj import CRS
+        except ImportError as error:
+            raise NotImplementedError from error
+        self.crs_type = CRS
+        self.crs = CRS.from_user_input(value)
+
+    def time_to_crs(self, value):
+        to_type(value, self.crs_type)
+
+    def time_to_wkt(self, value):
+        to_type(self.crs, str)
+
+    def time_to_epsg(self, value):
+        to_type(self.crs, int)
+
+    def time_to_json_dict(self, value):
+        to_type(self.crs, dict)
+
+
+class Geometries:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        try:
+            from shapely.geometry import Point, Polygon
+        except ImportError as error:
+            raise NotImplementedError from error
+        self.point_type = Point
+        self.polygon_type = Polygon
+        points = [Point(index, index + 0.5) for index in range(size)]
+        polygons = [Polygon([(0, 0), (index, 1), (1, 1)]) for index in range(size)]
+        self.wkt = [point.wkt for point in points]
+        self.wkb = [point.wkb for point in points]
+        self.wkb_hex = [polygon.wkb_hex for polygon in polygons]
+        self.coordinates = [(point.x, point.y) for point in points]
+        self.mixed = [point.wkt if index % 2 else point.wkb for index, point in enumerate(points)]
+
+    def time_wkt(self, size):
+        to_type(self.wkt, [self.point_type])
+
+    def time_wkb(self, size):
+        to_type(self.wkb, [self.point_type])
+
+    def time_wkb_hex(self, size):
+        to_type(self.wkb_hex, [self.polygon_type])
+
+    def time_coordinates(self, size):
+        to_type(self.coordinates, [self.point_type])
+
+    def time_mixed_encodings(self, size):
+        to_type(self.mixed, [self.point_type])
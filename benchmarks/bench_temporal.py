@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+from typepigeon import to_type
+
+SIZES = [10, 1000, 10000]
+
+
+class Datetimes:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        start = datetime(2021, 3, 26)
+        self.iso_strings = [str(start + timedelta(minutes=index)) for index in range(size)]
+        self.compact_strings = [(start + timedelta(minutes=index)).strftime("%Y%m%dT%H%M%S") for index in range(size)]
+        self.free_strings = [(start + timedelta(days=index % 1000)).strftime("%B %d, %Y") for index in range(size)]
+        self.datetimes = [start + timedelta(minutes=index) for index in range(size)]
+
+    def time_iso_strings(self, size):
+        to_type(self.iso_strings, [datetime])
+
+    def time_compact_strings(self, size):
+        to_type(self.compact_strings, [datetime])
+
+    def time_free_strings(self, size):
+        to_type(self.free_strings, [datetime])
+
+    def time_to_str(self, size):
+        to_type(self.datetimes, [str])
+
+
+class Timedeltas:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.strings = [f"{index % 7:02}:{index % 24:02}:{index % 60:02}:{index % 60:02}.5" for index in range(size)]
+        self.timedeltas = [timedelta(seconds=index * 1.5) for index in range(size)]
+
+    def time_parse(self, size):
+        to_type(self.strings, [timedelta])
+
+    def time_format(self, size):
+        to_type(self.timedeltas, [str])
+
+    def time_to_seconds(self, size):
+        to_type(self.timedeltas, [float])
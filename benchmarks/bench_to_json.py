@@ -0,0 +1,75 @@
+import io
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from uuid import UUID
+
+from typepigeon import dump_json, to_json
+
+SIZES = [10, 1000, 10000]
+
+
+class Color(Enum):
+    red = 1
+    green = 2
+
+
+SCALAR_CASES = {
+    "int": 5,
+    "str": "5",
+    "datetime": datetime(2021, 3, 26),
+    "timedelta": timedelta(hours=1),
+    "Decimal": Decimal("0.5"),
+    "Path": Path("a/b"),
+    "Enum": Color.red,
+}
+
+
+class Scalars:
+    params = [list(SCALAR_CASES)]
+    param_names = ["case"]
+
+    def setup(self, case):
+        self.value = SCALAR_CASES[case]
+
+    def time_to_json(self, case):
+        to_json(self.value)
+
+
+class Fallbacks:
+    """Types without a direct encoder, converted through the ``float`` -> ``int`` -> ``bool`` -> ``str`` fallback."""
+
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.uuids = [UUID(int=index) for index in range(size)]
+        self.complexes = [complex(index, 1) for index in range(size)]
+
+    def time_uuids(self, size):
+        to_json(self.uuids)
+
+    def time_complexes(self, size):
+        to_json(self.complexes)
+
+
+class Documents:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.document = {
+            f"record_{index}": {
+                "time": datetime(2021, 3, 26) + timedelta(minutes=index),
+                "values": [index, index + 0.5, str(index)],
+                "flag": index % 2 == 0,
+            }
+            for index in range(size)
+        }
+
+    def time_to_json(self, size):
+        to_json(self.document)
+
+    def time_dump_json(self, size):
+        dump_json(self.document, io.StringIO())
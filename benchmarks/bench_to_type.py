@@ -0,0 +1,81 @@
+from typing import Dict, List, Tuple
+
+from typepigeon import to_type, to_type_many
+
+SIZES = [10, 1000, 10000]
+
+
+SCALAR_CASES = {
+    "str -> int": ("5", int),
+    "str -> float": ("5.5", float),
+    "float -> int": (5.5, int),
+    "float -> str": (0.55, str),
+    "str -> bool": ("true", bool),
+    "int -> bool": (1, bool),
+    "str -> float (type name)": ("5.5", "float"),
+}
+
+
+class Scalars:
+    params = [list(SCALAR_CASES)]
+    param_names = ["case"]
+
+    def setup(self, case):
+        self.value, self.output_type = SCALAR_CASES[case]
+
+    def time_to_type(self, case):
+        to_type(self.value, self.output_type)
+
+
+class NestedCollections:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.mapping = {f"key_{index}": [(index, str(index + 0.5))] * 3 for index in range(size)}
+        self.records = [{"a": str(index), "b": [index, str(index + 1)]} for index in range(size)]
+
+    def time_literal_spec(self, size):
+        to_type(self.mapping, {str: [(int, float)]})
+
+    def time_generic_alias(self, size):
+        to_type(self.mapping, Dict[str, List[Tuple[int, float]]])
+
+    def time_records(self, size):
+        to_type(self.records, [{str: [float]}])
+
+
+class StringCollections:
+    """``literal_eval`` and string splitting of collections given as strings."""
+
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.literal = str(list(range(size)))
+        self.comma_separated = ", ".join(f"value_{index}" for index in range(size))
+
+    def time_literal_list(self, size):
+        to_type(self.literal, [int])
+
+    def time_comma_separated(self, size):
+        to_type(self.comma_separated, [str])
+
+
+class Batches:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.integers = list(range(size))
+        self.strings = [str(index) for index in range(size)]
+        self.mixed = [index if index % 2 else str(index) for index in range(size)]
+
+    def time_numbers(self, size):
+        to_type(self.integers, [float])
+
+    def time_number_strings(self, size):
+        to_type(self.strings, [int])
+
+    def time_to_type_many(self, size):
+        list(to_type_many(self.mixed, int))
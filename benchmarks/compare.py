@@ -0,0 +1,64 @@
+"""Compare two result files written by ``benchmarks/run.py``, and flag benchmarks that slowed down beyond a threshold.
+
+Exits with status 1 if any benchmark regressed, so that it can be used in CI.
+
+    python -m benchmarks.compare before.json after.json --threshold 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def compare_results(
+    before: dict[str, float], after: dict[str, float], threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Retrieve ``(name, before, after, ratio)`` of benchmarks present in both results whose time ratio exceeds the threshold."""
+    regressions = []
+    for name in sorted(before.keys() & after.keys()):
+        ratio = after[name] / before[name]
+        if ratio > threshold:
+            regressions.append((name, before[name], after[name], ratio))
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before", type=Path, help="results of the baseline")
+    parser.add_argument("after", type=Path, help="results to compare against the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="ratio of times (after / before) above which a benchmark counts as a regression",
+    )
+    parser.add_argument("--all", action="store_true", help="show every benchmark, not only regressions")
+    arguments = parser.parse_args(arguments)
+
+    with open(arguments.before) as before_file:
+        before = json.load(before_file)["results"]
+    with open(arguments.after) as after_file:
+        after = json.load(after_file)["results"]
+
+    regressions = compare_results(before, after, arguments.threshold)
+    rows = (
+        [(name, before[name], after[name], after[name] / before[name]) for name in sorted(before.keys() & after.keys())]
+        if arguments.all
+        else regressions
+    )
+    for name, before_seconds, after_seconds, ratio in rows:
+        flag = "REGRESSION" if ratio > arguments.threshold else "improved" if ratio < 1 / arguments.threshold else ""
+        print(f"{name:<80} {before_seconds * 1e6:12.2f} us {after_seconds * 1e6:12.2f} us {ratio:7.2f}x {flag}")
+
+    for name in sorted(before.keys() - after.keys()):
+        print(f"{name:<80} missing from {arguments.after}")
+
+    print(f"{len(regressions)} of {len(before.keys() & after.keys())} benchmarks slower than {arguments.threshold}x")
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Run the benchmarks in this directory without ``asv``, and write the results to a JSON file.
+
+The benchmark modules follow the conventions of ``asv`` (airspeed velocity): classes with ``params``, ``param_names``,
+``setup()``, and ``time_*()`` methods; raising ``NotImplementedError`` in ``setup()`` skips a benchmark.
+
+    python -m benchmarks.run results.json
+    python -m benchmarks.run results.json --filter Datetimes --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import platform
+import re
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import typepigeon
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+BENCHMARK_MODULES = sorted(path.stem for path in BENCHMARK_DIRECTORY.glob("bench_*.py"))
+
+
+def benchmark_cases(name_filter: str | None = None):
+    """Iterate over ``(name, class, method name, parameters)`` of all benchmarks matching the given regular expression."""
+    for module_name in BENCHMARK_MODULES:
+        module = importlib.import_module(f"benchmarks.{module_name}")
+        for class_name, benchmark_class in inspect.getmembers(module, inspect.isclass):
+            if benchmark_class.__module__ != module.__name__:
+                continue
+            params = getattr(benchmark_class, "params", [[]])
+            if len(params) > 0 and not isinstance(params[0], (list, tuple)):
+                params = [params]
+            for method_name in sorted(name for name in dir(benchmark_class) if name.startswith("time_")):
+                for parameters in itertools.product(*params) if any(params) else [()]:
+                    name = f"{module_name}.{class_name}.{method_name}"
+                    if len(parameters) > 0:
+                        name += f"({', '.join(str(parameter) for parameter in parameters)})"
+                    if name_filter is None or re.search(name_filter, name):
+                        yield name, benchmark_class, method_name, parameters
+
+
+def run_benchmark(benchmark_class: type, method_name: str, parameters: tuple, repeat: int) -> float | None:
+    """Time a single benchmark, returning the best time per call in seconds (or ``None`` if it was skipped)."""
+    benchmark = benchmark_class()
+    try:
+        if hasattr(benchmark, "setup"):
+            benchmark.setup(*parameters)
+    except NotImplementedError:
+        return None
+    method = getattr(benchmark, method_name)
+    timer = timeit.Timer(lambda: method(*parameters))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(arguments: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path, help="path of the JSON file to write results to")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose names match this regular expression")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing repetitions; the best is kept")
+    arguments = parser.parse_args(arguments)
+
+    results = {}
+    for name, benchmark_class, method_name, parameters in benchmark_cases(arguments.filter):
+        try:
+            seconds = run_benchmark(benchmark_class, method_name, parameters, arguments.repeat)
+        except Exception as error:  # noqa: BLE001
+            print(f"{name:<80} failed: {error!r}")
+            continue
+        print(f"{name:<80} {'skipped' if seconds is None else f'{seconds * 1e6:12.2f} us'}")
+        if seconds is not None:
+            results[name] = seconds
+
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(arguments.output, "w") as output_file:
+        json.dump(
+            {
+                "typepigeon": getattr(typepigeon, "__version__", None),
+                "python": sys.version,
+                "machine": platform.platform(),
+                "date": datetime.now(timezone.utc).isoformat(),
+                "results": results,
+            },
+            output_file,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from typepigeon import to_json, to_type
+from typepigeon.aio import ASYNC_INLINE_ENTRIES, async_to_json, async_to_type
+
+
+def test_async_to_type():
+    small_value = ["2021-03-26", "2021-03-27"]
+    large_value = {"values": small_value * ASYNC_INLINE_ENTRIES}
+
+    async def convert():
+        with ThreadPoolExecutor(1) as executor:
+            return await asyncio.gather(
+                async_to_type(small_value, [datetime]),
+                async_to_type(large_value, {str: [datetime]}),
+                async_to_type(large_value, {str: [datetime]}, executor=executor),
+                async_to_type(iter(small_value), [datetime]),
+                async_to_type([*small_value, "not a date"], [datetime], errors="coerce"),
+                async_to_type(large_value, {str: [str]}, copy=False),
+                async_to_type(
+                    {"values": [*small_value, "not a date"] * ASYNC_INLINE_ENTRIES}, {str: [datetime]}, errors="coerce"
+                ),
+            )
+
+    result_1, result_2, result_3, result_4, result_5, result_6, result_7 = asyncio.run(convert())
+
+    assert result_1 == to_type(small_value, [datetime])
+    assert result_2 == to_type(large_value, {str: [datetime]})
+    assert result_3 == result_2
+    assert result_4 == result_1
+    assert result_5 == [*result_1, None]
+    assert result_6 is large_value
+    assert result_7 == {"values": result_5 * ASYNC_INLINE_ENTRIES}
+
+
+def test_async_to_json():
+    small_value = {"test": [5, b"6", {3: datetime(2021, 3, 27)}]}
+    large_value = [small_value] * ASYNC_INLINE_ENTRIES
+
+    async def convert():
+        return await asyncio.gather(
+            async_to_json(small_value),
+            async_to_json(large_value),
+            async_to_json(large_value, bytes_encoding="hex"),
+        )
+
+    result_1, result_2, result_3 = asyncio.run(convert())
+
+    assert result_1 == to_json(small_value)
+    assert result_2 == to_json(large_value)
+    assert result_3 == to_json(large_value, bytes_encoding="hex")
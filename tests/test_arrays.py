@@ -0,0 +1,67 @@
+from array import array
+
+import pytest
+
+from typepigeon import to_type
+from typepigeon.arrays import MINIMUM_VECTORIZED_LENGTH, to_array, vectorized_conversion
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_vectorized_conversion():
+    integers = list(range(MINIMUM_VECTORIZED_LENGTH))
+    floats = [value + 0.5 for value in integers]
+
+    list_1 = to_type(integers, [float])
+    list_2 = to_type(floats, [int])
+    list_3 = to_type(floats, [str])
+    list_4 = to_type(numpy.arange(5), [float])
+    list_5 = to_type(numpy.array([0.5, 1.5]), (int,))
+    list_6 = to_type([True] * MINIMUM_VECTORIZED_LENGTH, [int])
+
+    assert list_1 == [float(value) for value in integers]
+    assert all(type(value) is float for value in list_1)
+    assert list_2 == integers
+    assert list_3 == [str(value) for value in floats]
+    assert list_4 == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert list_5 == (0, 1)
+    assert all(value is True for value in list_6)
+
+    # conversions that would differ from element-wise conversion are not vectorized
+    assert vectorized_conversion([1, 2.5], str) is None
+    assert vectorized_conversion([True, 2], int) is None
+    assert vectorized_conversion([float("nan")], int) is None
+    assert vectorized_conversion(["1", "2"], int) is None
+
+    with pytest.raises(ValueError):
+        to_type([*floats, float("nan")], [int])
+
+
+def test_convert_buffer():
+    doubles = memoryview(array("d", [value + 0.5 for value in range(MINIMUM_VECTORIZED_LENGTH)]))
+    data = bytes(range(256)) * 4
+
+    list_1 = to_type(doubles, [int])
+    list_2 = to_type(data, [float])
+    list_3 = to_type(bytearray(data), (str,))
+    list_4 = to_type(memoryview(bytes(range(6))).cast("B", (2, 3)), [[float]])
+
+    assert list_1 == list(range(MINIMUM_VECTORIZED_LENGTH))
+    assert list_2 == [float(value) for value in data]
+    assert list_3 == tuple(str(value) for value in data)
+    assert list_4 == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+    # single-precision floats and booleans are converted element by element
+    assert vectorized_conversion(memoryview(array("f", [0.1])), str) is None
+    assert vectorized_conversion(memoryview(bytes([0, 1])).cast("?"), int) is None
+
+
+def test_to_array():
+    array_1 = to_array([1, 2, 3], float)
+    array_2 = to_array(["1", "2", "3"], [int])
+    array_3 = to_array(numpy.array([0.5, 1.5]), bool)
+
+    assert array_1.dtype == numpy.float64
+    assert array_1.tolist() == [1.0, 2.0, 3.0]
+    assert array_2.tolist() == [1, 2, 3]
+    assert array_3.tolist() == [True, True]
@@ -0,0 +1,13 @@
+from typepigeon.backends import backend_available, backend_loaded, optional_backend
+
+
+def test_optional_backend():
+    dateutil = optional_backend("dateutil")
+
+    assert backend_available("dateutil")
+    assert backend_loaded("dateutil")
+    assert dateutil.parse("20210326").year == 2021
+
+    assert not backend_available("nonexistent_backend")
+    assert not backend_loaded("nonexistent_backend")
+    assert optional_backend("nonexistent_backend") is None
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from typepigeon import register_converter, to_type
+from typepigeon.converters import find_converter
+
+
+class Meters(float):
+    pass
+
+
+class Feet(float):
+    pass
+
+
+class Centimeters(Meters):
+    pass
+
+
+def test_register_converter():
+    register_converter(str, Meters, lambda value, output_type: output_type(value.rstrip("m")))
+    register_converter(Feet, Meters, lambda value, output_type: output_type(value * 0.3048))
+
+    meters_1 = to_type("5m", Meters)
+    meters_2 = to_type(Feet(10), Meters)
+    meters_3 = to_type(5, Meters)
+    centimeters_1 = to_type("5m", Centimeters)
+
+    assert type(meters_1) is Meters
+    assert meters_1 == 5.0
+    assert meters_2 == 3.048
+    assert meters_3 == 5.0
+    assert type(centimeters_1) is Centimeters
+
+    # registered converters do not affect unrelated conversions
+    assert to_type("5", float) == 5.0
+    assert to_type(timedelta(seconds=5), Meters) == 5.0
+
+
+def test_find_converter():
+    converter_1 = find_converter(str, Meters)
+    converter_2 = find_converter(str, Centimeters)
+    converter_3 = find_converter(int, bool)
+
+    assert converter_1 is converter_2
+    assert converter_3 is find_converter(str, bool)
+    assert converter_3 is not find_converter(timedelta, bool)
@@ -0,0 +1,82 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from io import StringIO
+
+import pytest
+
+from typepigeon import from_json, iter_typed, load_typed, to_type
+
+
+@dataclass
+class Observation:
+    station: str
+    time: datetime
+    value: float
+
+
+RECORDS = [
+    {"station": "8518750", "time": "2021-03-26 00:56", "value": "1.5"},
+    {"station": "8516945", "time": "2021-03-27", "value": -2.5e10},
+    {"station": "8531680", "time": "2021-03-28", "value": 12345678901234567890},
+]
+
+
+def test_iter_typed():
+    ndjson = "\n".join(json.dumps(record) for record in RECORDS)
+
+    result_1 = list(iter_typed(StringIO(ndjson), Observation))
+    result_2 = list(iter_typed(StringIO(json.dumps(RECORDS, indent=2)), Observation))
+    result_3 = list(iter_typed(StringIO(f"\n{ndjson}\n\n"), {str: str}))
+    result_4 = list(iter_typed(StringIO("[]"), Observation))
+    result_5 = list(iter_typed(StringIO(""), Observation))
+    result_6 = list(iter_typed(StringIO('[["1", "2"], ["3"]]'), [int]))
+
+    assert result_1 == to_type(RECORDS, [Observation])
+    assert result_2 == result_1
+    assert result_3 == to_type(RECORDS, [{str: str}])
+    assert result_4 == []
+    assert result_5 == []
+    assert result_6 == [[1, 2], [3]]
+
+
+def test_iter_typed_chunks(monkeypatch):
+    ndjson = "\n".join(json.dumps(record) for record in RECORDS)
+    array = json.dumps(RECORDS)
+
+    for chunk_size in (1, 2, 3, 7):
+        monkeypatch.setattr(from_json, "READ_CHUNK_SIZE", chunk_size)
+
+        # numbers and strings are split between chunks
+        assert list(iter_typed(StringIO(ndjson), dict)) == RECORDS
+        assert list(iter_typed(StringIO(array), dict)) == RECORDS
+        assert list(iter_typed(StringIO("1 2.5e3\n-10"), float)) == [1.0, 2500.0, -10.0]
+
+
+def test_iter_typed_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_typed(StringIO("[1 2]"), int))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_typed(StringIO("[1, 2"), int))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_typed(StringIO('{"a": 1}\n{"a":'), dict))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_typed(StringIO("[1]\n[2]"), [int]))
+
+
+def test_load_typed():
+    array = json.dumps(RECORDS)
+    ndjson = "\n".join(json.dumps(record) for record in RECORDS)
+
+    result_1 = load_typed(StringIO(array), [Observation])
+    result_2 = load_typed(StringIO(ndjson), (Observation,))
+    result_3 = load_typed(StringIO('{"a": "1", "b": 2}'), {str: float})
+    result_4 = load_typed(StringIO('["1", 2.5]'), (int, float))
+
+    assert result_1 == to_type(RECORDS, [Observation])
+    assert result_2 == tuple(result_1)
+    assert result_3 == {"a": 1.0, "b": 2.0}
+    assert result_4 == (1, 2.5)
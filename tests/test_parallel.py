@@ -0,0 +1,63 @@
+import multiprocessing
+from datetime import datetime
+
+import pytest
+
+from typepigeon import register_converter, to_type, to_type_parallel
+from typepigeon.parallel import PARALLEL_MINIMUM_LENGTH
+
+
+class CentimetersTest(float):
+    pass
+
+
+def centimeters_from_str(value: str, output_type: type) -> CentimetersTest:
+    return output_type(value.rstrip("cm"))
+
+
+def test_to_type_parallel():
+    strings = [f"2021-03-{index % 28 + 1:02} {index % 24:02}:00" for index in range(PARALLEL_MINIMUM_LENGTH * 2)]
+    mapping = {str(index): [string] for index, string in enumerate(strings)}
+
+    result_1 = to_type_parallel(strings, [datetime], workers=2, chunk_size=300)
+    result_2 = to_type_parallel(tuple(strings), (str,), workers=2, chunk_size=300)
+    result_3 = to_type_parallel(mapping, {int: [datetime]}, workers=2, chunk_size=300)
+    result_4 = to_type_parallel(strings, [datetime], workers=2)
+
+    assert result_1 == to_type(strings, [datetime])
+    assert result_2 == tuple(strings)
+    assert result_3 == to_type(mapping, {int: [datetime]})
+    assert list(result_3) == list(range(len(strings)))
+    assert result_4 == result_1
+
+
+def test_to_type_parallel_context():
+    strings = [f"2021-03-{index % 28 + 1:02}" for index in range(PARALLEL_MINIMUM_LENGTH)]
+    lengths = [f"{index}cm" for index in range(PARALLEL_MINIMUM_LENGTH)]
+    register_converter(str, CentimetersTest, centimeters_from_str)
+
+    spawn_context = multiprocessing.get_context("spawn")
+    result_1 = to_type_parallel(strings, [datetime], workers=2, chunk_size=500, mp_context=spawn_context)
+
+    assert result_1 == to_type(strings, [datetime])
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requires the fork start method")
+    # workers copied from the current process have the converters registered in it
+    fork_context = multiprocessing.get_context("fork")
+    result_2 = to_type_parallel(lengths, [CentimetersTest], workers=2, chunk_size=500, mp_context=fork_context)
+
+    assert result_2 == [float(index) for index in range(len(lengths))]
+    assert type(result_2[-1]) is CentimetersTest
+
+
+def test_to_type_parallel_serial():
+    result_1 = to_type_parallel(["1", "2"], [int], workers=2)
+    result_2 = to_type_parallel("1, 2", [int], workers=2)
+    result_3 = to_type_parallel(list(range(PARALLEL_MINIMUM_LENGTH)), [float], workers=2, chunk_size=10)
+    result_4 = to_type_parallel("5", int, workers=2)
+
+    assert result_1 == [1, 2]
+    assert result_2 == [1, 2]
+    assert result_3 == [float(value) for value in range(PARALLEL_MINIMUM_LENGTH)]
+    assert result_4 == 5
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from typepigeon import profile_conversions, profiling, to_type
+from typepigeon.profiling import ConversionProfile, disable_profiling, enable_profiling
+
+
+def test_profile_conversions():
+    with profile_conversions() as profile:
+        to_type(["1", "yes", "2"], [bool])
+        to_type("1, 2, x", [str])
+        to_type("1 2, 3", [str])
+        to_type({"a": "2021-03-26"}, {str: datetime})
+        with pytest.raises(ValueError):
+            to_type("x", int)
+
+    stats = profile.stats()
+
+    assert stats[("list", "[bool]", "elementwise")].calls == 1
+    assert stats[("str", "bool", "literal_eval")].calls == 2
+    assert stats[("str", "bool", "bool")].fallbacks == 1
+    assert stats[("str", "[str]", "tokenizer")].fallbacks == 0
+    assert stats[("str", "[str]", "split")].fallbacks == 1
+    assert stats[("str", "datetime", "parse_datetime")].calls == 1
+    assert stats[("str", "int", "constructor")].errors == 1
+    assert all(branch_stats.seconds > 0 for branch_stats in stats.values())
+
+    report = profile.report(limit=2).splitlines()
+    assert report[0].split()[:3] == ["input", "type", "output"]
+    assert len(report) == 3
+
+    profile.reset()
+    assert profile.stats() == {}
+
+
+def test_enable_profiling():
+    profile = enable_profiling(ConversionProfile())
+    try:
+        to_type("5", float)
+    finally:
+        disable_profiling()
+    to_type("6", float)
+
+    assert profiling.ACTIVE_PROFILE is None
+    assert profile.stats()[("str", "float", "constructor")].calls == 1
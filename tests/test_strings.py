@@ -0,0 +1,55 @@
+import ast
+
+import pytest
+
+from typepigeon.strings import split_collection_string
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "[1, 2, 3]",
+        "[-1, +2.5, 3e2, .5]",
+        "(1, 'a', \"b\", True, None)",
+        "1, 2, 3",
+        "[]",
+        "()",
+        "['a, b', 'c']",
+        "[0, 00, -0]",
+    ],
+)
+def test_split_literal(string):
+    assert split_collection_string(string) == ast.literal_eval(string)
+
+
+@pytest.mark.parametrize(
+    ("string", "entries"),
+    [
+        ("test 1, test 2, test 3", ["test 1", "test 2", "test 3"]),
+        ("a", ["a"]),
+        ("5", ["5"]),
+        ("a\nb\n", ["a", "b"]),
+        ("1\n2", ["1", "2"]),
+    ],
+)
+def test_split_text(string, entries):
+    assert split_collection_string(string) == entries
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "[[1, 2], [3]]",
+        "{'a': 1}",
+        "('a')",
+        "'abc'",
+        "['a\\nb']",
+        "1,",
+        "007, 1",
+        "1_000, 2",
+        "a # comment",
+        "[a, b]",
+    ],
+)
+def test_split_deferred(string):
+    assert split_collection_string(string) is None
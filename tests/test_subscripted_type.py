@@ -3,7 +3,7 @@ from typing import Dict, List, Tuple, Union
 
 import pytest
 
-from typepigeon.types import subscripted_type
+from typepigeon.types import canonical_type, subscripted_type, type_from_canonical
 
 
 @pytest.mark.skipif(sys.version_info < (3, 8), reason="requires Python 3.8 or greater")
@@ -34,3 +34,22 @@ def test_mixed_types():
 def test_union_types():
     with pytest.raises(NotImplementedError):
         subscripted_type(Union[str, int])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires Python 3.8 or greater")
+def test_canonical_type():
+    canonical_type_1 = canonical_type(Dict[str, List[Tuple[int, float]]])
+    canonical_type_2 = canonical_type({str: [(int, float)]})
+    canonical_type_3 = canonical_type([Tuple[float, List[int]]])
+
+    assert canonical_type_1 == (dict, ((str, (list, ((tuple, (int, float)),))),))
+    assert canonical_type_2 == canonical_type_1
+    assert hash(canonical_type_3) == hash(canonical_type([(float, [int])]))
+    assert canonical_type(int) is int
+    assert canonical_type(List[str]) is canonical_type(List[str])
+
+    assert type_from_canonical(canonical_type_1) == {str: [(int, float)]}
+    assert type_from_canonical(canonical_type_3) == [(float, [int])]
+
+    with pytest.raises(NotImplementedError):
+        canonical_type([Union[str, int]])
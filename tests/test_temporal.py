@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from typepigeon import to_type
+from typepigeon.temporal import format_timedeltas, parse_datetime, parse_timedelta, parse_timedeltas
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "20210326",
+        "20210326T0056",
+        "20210326T005600",
+        "2021-03-26",
+        "2021-03-26 00:56",
+        "2021-03-26T00:56:00",
+        "2021-03-26 00:56:00.5",
+        "2021-03-26T00:56:00.123456",
+        "March 26, 2021",
+    ],
+)
+def test_parse_datetime(string):
+    from dateutil.parser import parse
+
+    assert parse_datetime(string) == parse(string)
+
+
+def test_parse_datetime_invalid():
+    with pytest.raises(ValueError):
+        parse_datetime("2021-13-01")
+
+    with pytest.raises(ValueError):
+        parse_datetime("not a datetime")
+
+    assert parse_datetime("2021-03-26") is parse_datetime("2021-03-26")
+    assert parse_datetime("2021-03-26") == datetime(2021, 3, 26)
+
+
+def test_parse_timedeltas():
+    strings = ["01:13:20:15", "00:00:00:00.5", "-01:00:00:30", "1.5:00:00:00"] * 500
+
+    assert parse_timedeltas(strings) == [parse_timedelta(string) for string in strings]
+    assert parse_timedeltas(strings[:2]) == [timedelta(days=1, hours=13, minutes=20, seconds=15), timedelta(seconds=0.5)]
+    assert parse_timedeltas(["20:15", "13:20:15"]) == [
+        timedelta(minutes=20, seconds=15),
+        timedelta(hours=13, minutes=20, seconds=15),
+    ]
+    assert parse_timedeltas([]) == []
+
+    with pytest.raises(ValueError):
+        parse_timedeltas(["00:15", "00:1x"])
+
+
+def test_format_timedeltas():
+    values = [timedelta(days=1, hours=1), timedelta(seconds=-1.5), timedelta(microseconds=1), timedelta.max] * 500
+
+    assert format_timedeltas(values) == [to_type(value, str) for value in values]
+    assert format_timedeltas(values[:2]) == ["25:00:00.0", "-1:59:58.5"]
+
+
+def test_timedelta_sequences():
+    strings = ["13:20:15.25", "00:00:01"] * 1000
+
+    assert to_type(strings, [timedelta]) == [to_type(string, timedelta) for string in strings]
+    assert to_type(to_type(strings, [timedelta]), [str]) == ["13:20:15.2", "00:00:01.0"] * 1000
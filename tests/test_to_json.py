@@ -1,8 +1,18 @@
-from datetime import datetime
-from enum import Enum
+import json
+import sys
+from array import array
+from collections.abc import Collection, Iterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum, Flag
+from io import StringIO
 from pathlib import Path
+from uuid import UUID
+
+import pytest
 
 from typepigeon import to_json
+from typepigeon.to_json import dump_json, iter_json
 
 
 class FloatTest:
@@ -31,6 +41,23 @@ class EnumerationTest(Enum):
     test_1 = "test_1"
 
 
+class RowsTest(Collection):
+    """Collection yielding a new list for each row, which is released once converted."""
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.rows
+
+    def __iter__(self) -> Iterator:
+        for row in self.rows:
+            yield [*row]
+
+
 def test_convert_to_json():
     result_1 = to_json(5)
     result_2 = to_json("5")
@@ -69,3 +96,186 @@ def test_convert_to_json():
     assert result_10 == "test_1"
 
     assert result_11 == "/path/test"
+
+
+def test_iter_json():
+    values = [
+        5,
+        "5",
+        None,
+        float("nan"),
+        -1.5e100,
+        'ünïcode "quoted"',
+        FloatTest(5.5),
+        IntegerTest(5.0),
+        EnumerationTest.test_1,
+        Path("/path/test"),
+        datetime(2021, 3, 26),
+        [FloatTest(5), "6", {3: datetime(2021, 3, 27), None: True, 1.5: False}],
+        {"test": [FloatTest(5), "6", {3: datetime(2021, 3, 27)}], "empty": [[], {}, ()]},
+    ]
+
+    for value in values:
+        assert "".join(iter_json(value)) == json.dumps(to_json(value))
+
+
+def test_dump_json():
+    value = {"test": [FloatTest(5), "6", {3: datetime(2021, 3, 27)}] * 1000}
+
+    output = StringIO()
+    dump_json(value, output)
+
+    assert output.getvalue() == json.dumps(to_json(value))
+    assert json.loads(output.getvalue()) == json.loads(json.dumps(to_json(value)))
+
+
+def test_json_encoders():
+    result_1 = to_json([datetime(2021, 3, 26), date(2021, 3, 27)])
+    result_2 = to_json(timedelta(hours=1))
+    result_3 = to_json(Decimal("2.5"))
+    result_4 = to_json(UUID(int=5))
+    result_5 = to_json([IntegerTest(5), IntegerTest(6)])
+    result_6 = to_json(None)
+
+    assert result_1 == ["2021-03-26 00:00:00", "2021-03-27"]
+    assert result_2 == 3600.0
+    assert result_3 == 2.5
+    assert result_4 == "00000000-0000-0000-0000-000000000005"
+    assert result_5 == [5, 6]
+    assert result_6 is None
+
+
+def test_convert_bytes():
+    doubles = memoryview(array("d", [1.5, 2.5]))
+
+    result_1 = to_json(b"binary")
+    result_2 = to_json([bytearray(b"binary")], bytes_encoding="hex")
+    result_3 = to_json({"data": memoryview(b"binary")}, bytes_encoding="list")
+    result_4 = to_json(doubles[::-1], bytes_encoding="list")
+    result_5 = "".join(iter_json({"data": doubles}, bytes_encoding="hex"))
+
+    with pytest.raises(ValueError):
+        to_json(b"binary", bytes_encoding="ascii")
+
+    assert result_1 == "YmluYXJ5"
+    assert result_2 == ["62696e617279"]
+    assert result_3 == {"data": [98, 105, 110, 97, 114, 121]}
+    assert result_4 == [2.5, 1.5]
+    assert result_5 == f'{{"data": "{doubles.tobytes().hex()}"}}'
+
+
+def test_convert_enum():
+    class ColorTest(Enum):
+        RED = 1
+        CRIMSON = 1  # noqa: PIE796 (alias of `RED`)
+        GREEN = "g"
+
+    class PermissionTest(Flag):
+        READ = 1
+        WRITE = 2
+
+    result_1 = to_json([ColorTest.RED, ColorTest.CRIMSON, ColorTest.GREEN])
+    result_2 = to_json({ColorTest.GREEN: ColorTest.RED})
+    result_3 = to_json(PermissionTest.READ | PermissionTest.WRITE)
+    result_4 = "".join(iter_json([ColorTest.GREEN, PermissionTest.WRITE]))
+
+    assert result_1 == ["RED", "RED", "GREEN"]
+    assert result_2 == {"GREEN": "RED"}
+    assert result_3 == (PermissionTest.READ | PermissionTest.WRITE).name
+    assert result_4 == '["GREEN", "WRITE"]'
+
+
+def test_convert_shared():
+    values = {"a": [1, 2.5, None], "b": {"c": "d"}}
+    mixed = {"a": [1, 2.5], "b": [datetime(2021, 3, 27)], "c": ({"d": 1},)}
+
+    result_1 = to_json(values, copy=False)
+    result_2 = to_json(values)
+    result_3 = to_json(mixed, copy=False)
+
+    assert result_1 is values
+    assert result_2 == values
+    assert result_2 is not values
+    assert result_3 == {"a": [1, 2.5], "b": ["2021-03-27 00:00:00"], "c": [{"d": 1}]}
+    assert result_3["a"] is mixed["a"]
+    assert result_3["c"][0] is mixed["c"][0]
+
+
+def test_convert_str_subclass():
+    class StringTest(str):
+        __slots__ = ()
+
+    class OtherStringTest(str):
+        __slots__ = ()
+
+    result_1 = to_json([StringTest("abc"), StringTest("1.5"), StringTest("2")])
+    result_2 = to_json([OtherStringTest("1.5"), OtherStringTest("abc"), OtherStringTest("2")])
+    result_3 = to_json([StringTest("2"), StringTest("abc")])
+
+    assert result_1 == [True, 1.5, 2.0]
+    assert result_2 == [1.5, True, 2.0]
+    assert result_3 == [2.0, True]
+
+
+def test_deeply_nested():
+    depth = sys.getrecursionlimit() * 2
+    value = []
+    for index in range(depth):
+        value = [index, {"nested": value}]
+
+    result = to_json(value)
+    for index in reversed(range(depth)):
+        assert result[0] == index
+        result = result[1]["nested"]
+    assert result == []
+
+    chunks = "".join(iter_json(value))
+    assert chunks.startswith(f'[{depth - 1}, {{"nested": [{depth - 2}, {{"nested": ')
+    assert chunks.endswith('[0, {"nested": []}]' + "}]" * (depth - 1))
+
+
+def test_circular_reference():
+    value = {"a": [1, 2]}
+    value["a"].append(value)
+
+    with pytest.raises(ValueError):
+        to_json(value)
+
+    with pytest.raises(ValueError):
+        "".join(iter_json(value))
+
+    with pytest.raises(ValueError):
+        to_json(value, copy=False)
+
+
+def test_shared_reference():
+    metadata = {"time": datetime(2021, 3, 27), "values": [1, (2, 3)]}
+    value = [metadata, {"metadata": metadata}, (metadata,)]
+
+    result_1 = to_json(value)
+    result_2 = to_json(value, copy=False)
+    result_3 = "".join(iter_json(value))
+
+    expected = {"time": "2021-03-27 00:00:00", "values": [1, [2, 3]]}
+    assert result_1 == [expected, {"metadata": expected}, [expected]]
+    assert result_1[0] is result_1[1]["metadata"] is result_1[2][0]
+    assert result_2 == result_1
+    assert result_2[0] is result_2[1]["metadata"] is result_2[2][0]
+    assert json.loads(result_3) == result_1
+
+    shared = [1, 2]
+    assert to_json([shared, {"b": shared}]) == [[1, 2], {"b": [1, 2]}]
+
+
+def test_temporary_collections():
+    rows = [(1, 2), (3, 4), (5, 6), (7, 8)]
+
+    result_1 = to_json(RowsTest(rows))
+    result_2 = to_json({"rows": RowsTest(rows)})
+
+    assert result_1 == [[1, 2], [3, 4], [5, 6], [7, 8]]
+    assert result_2 == {"rows": result_1}
+    assert to_json(RowsTest(rows), copy=False) == result_1
+
+    numpy = pytest.importorskip("numpy")
+    assert to_json(numpy.arange(12).reshape(4, 3)) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]]
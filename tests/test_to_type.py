@@ -1,9 +1,10 @@
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, Dict, Tuple
 
 import pytest
 
-from typepigeon.to_type import to_type
+from typepigeon.to_type import ConversionErrors, ConversionPlan, compile_converter, to_type, to_type_many
 
 
 def test_convert_str():
@@ -131,3 +132,118 @@ def test_convert_none():
 
     assert none_1 is None
     assert none_2 is None
+
+
+def test_compile_converter():
+    converter_1 = compile_converter({str: [float]})
+    converter_2 = compile_converter(Dict[str, Tuple[int, datetime]])
+    converter_3 = compile_converter("int")
+
+    converted_1 = converter_1({"a": [1, "2.5"], 3: ()})
+    converted_2 = converter_1({"b": "4, 5"})
+    converted_3 = converter_2({"a": ("1", "20210326")})
+    converted_4 = converter_3("5")
+
+    with pytest.raises(ValueError):
+        converter_2({"a": (1, "20210326", 3)})
+
+    with pytest.raises(TypeError):
+        ConversionPlan(int)
+
+    assert isinstance(converter_1, ConversionPlan)
+    assert converted_1 == {"a": [1.0, 2.5], "3": []}
+    assert converted_2 == {"b": [4.0, 5.0]}
+    assert converted_3 == {"a": (1, datetime(2021, 3, 26))}
+    assert converted_4 == 5
+
+    assert converter_1({"a": [1]}) == to_type({"a": [1]}, {str: [float]})
+
+
+def test_to_type_many():
+    values_1 = to_type_many(["1", 2.5, 3], int)
+    values_2 = to_type_many([{"a": "1"}, {"b": 2}], {str: float})
+    values_3 = to_type_many(iter(["20210326", datetime(2021, 3, 27)]), datetime)
+
+    assert not isinstance(values_1, list)
+
+    assert list(values_1) == [1, 2, 3]
+    assert list(values_2) == [{"a": 1.0}, {"b": 2.0}]
+    assert list(values_3) == [datetime(2021, 3, 26), datetime(2021, 3, 27)]
+
+    value = datetime(2021, 3, 27)
+    assert next(to_type_many([value], datetime)) is value
+
+
+def test_convert_errors():
+    @dataclass
+    class Observation:
+        time: datetime
+        value: float
+
+    result_1 = to_type(["2021-03-26", "not a date", None], [datetime], errors="coerce")
+    result_2 = to_type({"a": ["1", "b"], "c": "2, x", 3: ["4"]}, {str: [int]}, errors="coerce")
+    result_3 = to_type({"a": 1, "b": "x"}, {str: float}, errors="coerce")
+    result_4 = to_type(
+        [{"time": "x", "value": "1"}, ["2021-03-26", "y"], "not a record", {"value": 1}],
+        [Observation],
+        errors="coerce",
+    )
+    result_5 = to_type(["1", "2"], (int, str, float), errors="coerce")
+    result_6 = to_type("x", int, errors="coerce")
+    result_7 = to_type(["1", 2.5], [float], errors="collect")
+
+    with pytest.raises(ConversionErrors) as error:
+        to_type([["1", "b"], ["2"], ["q"]], [[int]], errors="collect")
+
+    with pytest.raises(ValueError):
+        to_type([["1", "b"]], [[int]])
+
+    with pytest.raises(ValueError):
+        to_type([1], [int], errors="ignore")
+
+    assert result_1 == [datetime(2021, 3, 26), None, None]
+    assert result_2 == {"a": [1, None], "c": [2, None], "3": [4]}
+    assert result_3 == {"a": 1.0, "b": None}
+    assert result_4 == [Observation(None, 1.0), Observation(datetime(2021, 3, 26), None), None, None]
+    assert result_5 is None
+    assert result_6 is None
+    assert result_7 == [1.0, 2.5]
+
+    assert error.value.value == [[1, None], [2], [None]]
+    assert [path for path, _ in error.value.errors] == [(0, 1), (2, 0)]
+    assert all(isinstance(exception, ValueError) for _, exception in error.value.errors)
+
+
+def test_convert_errors_string():
+    for errors in ("raise", "coerce", "collect"):
+        result_1 = to_type("{'a': 1, 'b': '2.5'}", {str: float}, errors=errors)
+        result_2 = to_type('{"a": ["1", 2]}', {str: [int]}, errors=errors)
+        result_3 = to_type("[1, 2]", {str: int}, errors=errors)
+
+        assert result_1 == {"a": 1.0, "b": 2.5}
+        assert result_2 == {"a": [1, 2]}
+        assert result_3 == [1, 2]
+
+
+def test_convert_shared():
+    floats = [1.5, 2.0]
+    mapping = {"a": [1.5], "b": [2.5]}
+    records = [{"a": [1.5]}, {"b": ["2.5"]}]
+
+    result_1 = to_type(floats, [float], copy=False)
+    result_2 = to_type(floats, [float])
+    result_3 = to_type(mapping, {str: [float]}, copy=False)
+    result_4 = to_type(records, [{str: [float]}], copy=False)
+    result_5 = to_type((floats, [1]), [[float]], copy=False)
+    result_6 = to_type(floats, [int], copy=False)
+
+    assert result_1 is floats
+    assert result_2 == floats
+    assert result_2 is not floats
+    assert result_3 is mapping
+    assert result_4 == [{"a": [1.5]}, {"b": [2.5]}]
+    assert result_4[0] is records[0]
+    assert result_4[1] is not records[1]
+    assert result_5 == [[1.5, 2.0], [1.0]]
+    assert result_5[0] is floats
+    assert result_6 == [1, 2]
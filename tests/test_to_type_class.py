@@ -1,22 +1,70 @@
-from enum import Enum
+from __future__ import annotations
+
+import pickle
+import sys
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime
+from enum import Enum, Flag
+from typing import Any, NamedTuple, Optional, TypedDict
 
 import pytest
 
-from typepigeon import to_type
+from typepigeon import compile_converter, to_type
+from typepigeon.records import record_fields
 
 
 class ValueTest:
     def __init__(self, value: int):
         self.value = value
 
-    def __eq__(self, other: "ValueTest") -> bool:
+    def __eq__(self, other: ValueTest) -> bool:
         return self.value == other.value
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
 
 class EnumerationTest(Enum):
     test_1 = "test_1"
 
 
+class ColorTest(Enum):
+    RED = 1
+    CRIMSON = 1  # noqa: PIE796 (alias of `RED`)
+    GREEN = "g"
+    Blue = 2.5
+    blue = 3
+
+
+class PermissionTest(Flag):
+    READ = 1
+    WRITE = 2
+
+
+@dataclass
+class DataclassTest:
+    name: str
+    # annotations are evaluated by `to_type()`, and `X | None` requires Python 3.10
+    time: Optional[datetime] = None  # noqa: UP045
+    values: dict[str, float] = field(default_factory=dict)
+    children: list[DataclassTest] = field(default_factory=list)
+
+
+class NamedTupleTest(NamedTuple):
+    x: float
+    y: float = 0.0
+
+
+class LinkTest(NamedTuple):
+    value: int
+    link: Optional[LinkTest] = None  # noqa: UP045
+
+
+class BranchTest(TypedDict):
+    value: int
+    branches: list[BranchTest]
+
+
 def test_convert_class():
     class_1 = to_type(5, ValueTest)
 
@@ -30,3 +78,121 @@ def test_convert_class():
 
     assert enum_1 == EnumerationTest.test_1
     assert enum_2 == "test_1"
+
+
+def test_convert_enum():
+    enum_1 = to_type(["RED", "CRIMSON", 1, 1.0, "g", "GREEN", 2.5], [ColorTest])
+    enum_2 = to_type(["red", "crimson", "green"], [ColorTest])
+    enum_3 = to_type(["Blue", "blue"], [ColorTest])
+    enum_4 = to_type(3, PermissionTest)
+    enum_5 = pickle.loads(pickle.dumps(compile_converter([ColorTest])))(["red", 3])  # noqa: S301 (round trip of a converter built by this test)
+
+    with pytest.raises(ValueError):
+        # names that differ only in case from several members are ambiguous
+        to_type("BLUE", ColorTest)
+
+    with pytest.raises(ValueError):
+        to_type([1], ColorTest)
+
+    assert enum_1 == [ColorTest.RED] * 4 + [ColorTest.GREEN] * 2 + [ColorTest.Blue]
+    assert enum_2 == [ColorTest.RED, ColorTest.RED, ColorTest.GREEN]
+    assert enum_3 == [ColorTest.Blue, ColorTest.blue]
+    assert enum_4 == PermissionTest.READ | PermissionTest.WRITE
+    assert enum_5 == [ColorTest.RED, ColorTest.blue]
+
+
+def test_convert_record():
+    class TypedDictTest(TypedDict):
+        point: NamedTupleTest
+        enumeration: EnumerationTest
+
+    record_1 = to_type({"name": 5, "time": "2021-03-26", "values": {"a": "1"}, "other": None}, DataclassTest)
+    record_2 = to_type({"name": "a", "children": [{"name": "b", "children": [{"name": "c"}]}]}, DataclassTest)
+    record_3 = to_type(["1", "2"], NamedTupleTest)
+    record_4 = to_type('{"x": 1}', NamedTupleTest)
+    record_5 = to_type({"point": [1, 2], "enumeration": "test_1"}, TypedDictTest)
+    record_6 = to_type([{"x": "1"}, (2, 3)], [NamedTupleTest])
+
+    with pytest.raises(TypeError):
+        to_type({"time": "2021-03-26"}, DataclassTest)
+
+    with pytest.raises(ValueError):
+        to_type([1, 2, 3], NamedTupleTest)
+
+    assert record_1 == DataclassTest("5", datetime(2021, 3, 26), {"a": 1.0})
+    assert record_2 == DataclassTest("a", children=[DataclassTest("b", children=[DataclassTest("c")])])
+    assert record_3 == NamedTupleTest(1.0, 2.0)
+    assert record_4 == NamedTupleTest(1.0)
+    assert record_5 == {"point": NamedTupleTest(1.0, 2.0), "enumeration": EnumerationTest.test_1}
+    assert record_6 == [NamedTupleTest(1.0), NamedTupleTest(2.0, 3.0)]
+    assert to_type(record_1, DataclassTest) is record_1
+
+
+def test_convert_record_unresolved_annotation():
+    @dataclass
+    class LocalDataclassTest:
+        name: str
+        missing: UndefinedTest  # noqa: F821
+        children: list[LocalDataclassTest] = field(default_factory=list)
+        scale: InitVar[float] = 1.0
+
+        def __post_init__(self, scale: float):
+            self.scaled = scale
+
+    class LocalNamedTupleTest(NamedTuple):
+        name: str
+        missing: UndefinedTest  # noqa: F821
+
+    class LocalTypedDictTest(TypedDict):
+        name: str
+        missing: UndefinedTest  # noqa: F821
+
+    record_1 = to_type({"name": 5, "missing": "1", "children": [{"name": 6, "missing": 2}], "scale": "2"}, LocalDataclassTest)
+    record_2 = to_type({"name": 5, "missing": "1"}, LocalNamedTupleTest)
+    record_3 = to_type({"name": 5, "missing": "1"}, LocalTypedDictTest)
+
+    assert record_fields(LocalDataclassTest) == {
+        "name": str,
+        "missing": Any,
+        "children": list[LocalDataclassTest],
+        "scale": float,
+    }
+    assert record_fields(LocalNamedTupleTest) == {"name": str, "missing": Any}
+    assert record_fields(LocalTypedDictTest) == {"name": str, "missing": Any}
+
+    assert record_1.name == "5"
+    assert record_1.missing == "1"
+    assert record_1.children == [LocalDataclassTest("6", 2)]
+    assert record_1.scaled == 2.0
+    assert record_2 == LocalNamedTupleTest("5", "1")
+    assert record_3 == {"name": "5", "missing": "1"}
+
+
+def test_convert_recursive_record():
+    dataclass_input, dataclass_expected = {"name": 0}, DataclassTest("0")
+    link_input, link_expected = ["0", None], LinkTest(0)
+    branch_input, branch_expected = {"value": "0", "branches": []}, {"value": 0, "branches": []}
+    for index in range(1, 20):
+        dataclass_input = {"name": index, "children": [dataclass_input]}
+        dataclass_expected = DataclassTest(str(index), children=[dataclass_expected])
+        link_input = [str(index), link_input]
+        link_expected = LinkTest(index, link_expected)
+        branch_input = {"value": str(index), "branches": [branch_input]}
+        branch_expected = {"value": index, "branches": [branch_expected]}
+
+    record_1 = to_type(dataclass_input, DataclassTest)
+    record_2 = to_type(link_input, LinkTest)
+    record_3 = to_type(branch_input, BranchTest)
+
+    assert record_1 == dataclass_expected
+    assert record_2 == link_expected
+    assert record_3 == branch_expected
+
+    # records are converted recursively, so the depth of the input is limited by the recursion limit
+    deep_input = None
+    for index in range(sys.getrecursionlimit()):
+        deep_input = [index, deep_input]
+
+    for errors in ("raise", "coerce", "collect"):
+        with pytest.raises(RecursionError, match="nested deeper than the recursion limit"):
+            to_type(deep_input, LinkTest, errors=errors)
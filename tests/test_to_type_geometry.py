@@ -49,6 +49,8 @@ def test_convert_geometry():
     geometry_3 = to_type([(0, 1), (1, 1), (1, 0), (0, 0)], MultiPoint)
     geometry_4 = to_type([(0, 1), (1, 1), (1, 0), (0, 0)], LineString)
     geometry_5 = to_type([(0, 1), (1, 1), (1, 0), (0, 0)], Polygon)
+    geometry_6 = to_type(bytearray(Point(0, 1).wkb), Point)
+    geometry_7 = to_type(memoryview(Polygon([(0, 1), (1, 1), (1, 0)]).wkb), Polygon)
 
     with pytest.raises(TypeError):
         to_type(Point(0, 1), MultiPoint)
@@ -58,3 +60,62 @@ def test_convert_geometry():
     assert geometry_3 == MultiPoint([(0, 1), (1, 1), (1, 0), (0, 0)])
     assert geometry_4 == LineString([(0, 1), (1, 1), (1, 0), (0, 0)])
     assert geometry_5 == Polygon([(0, 1), (1, 1), (1, 0), (0, 0)])
+    assert geometry_6 == Point((0, 1))
+    assert geometry_7 == Polygon([(0, 1), (1, 1), (1, 0)])
+
+
+@pytest.mark.spatial()
+def test_convert_geometries():
+    from shapely.geometry import Point, Polygon
+
+    from typepigeon.arrays import MINIMUM_VECTORIZED_LENGTH
+    from typepigeon.spatial import vectorized_geometries
+
+    points = [Point(index, index + 1) for index in range(MINIMUM_VECTORIZED_LENGTH)]
+    polygons = [Polygon([(0, 0), (index, 1), (1, 1)]) for index in range(MINIMUM_VECTORIZED_LENGTH)]
+
+    geometries_1 = to_type([point.wkt for point in points], [Point])
+    geometries_2 = to_type([point.wkb for point in points], [Point])
+    geometries_3 = to_type([polygon.wkb_hex for polygon in polygons], [Polygon])
+    geometries_4 = to_type([(point.x, point.y) for point in points], [Point])
+    geometries_5 = to_type([point.wkt for point in points[:-1]] + [points[-1].wkb], [Point])
+
+    assert geometries_1 == points
+    assert geometries_2 == points
+    assert geometries_3 == polygons
+    assert geometries_4 == points
+    assert geometries_5 == points
+
+    # heterogeneous encodings, and geometries of other types, are converted element by element
+    assert vectorized_geometries([points[0].wkt, points[1].wkb], Point) is None
+    assert vectorized_geometries([polygons[0].wkt], Point) is None
+
+
+@pytest.mark.spatial()
+def test_crs_cache():
+    from pyproj import CRS
+
+    from typepigeon.spatial import clear_crs_cache, crs_cache_info
+
+    clear_crs_cache()
+
+    crs_1 = to_type(4326, CRS)
+    crs_2 = to_type(4326, CRS)
+    crs_3 = to_type("EPSG:4326", CRS)
+
+    assert crs_1 is crs_2
+    assert crs_3 == crs_1
+    assert crs_cache_info().hits == 1
+    assert crs_cache_info().misses == 2
+
+    json_1 = to_type(crs_1, dict)
+    json_1["name"] = "modified"
+
+    assert to_type(crs_1, int) == 4326
+    assert to_type(crs_1, int) == 4326
+    assert to_type(crs_1, dict)["name"] == "WGS 84"
+    assert to_type(crs_1, str) == crs_1.to_wkt()
+
+    clear_crs_cache()
+
+    assert crs_cache_info() == (0, 0, crs_cache_info().maxsize, 0)
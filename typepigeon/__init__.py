@@ -1,9 +1,28 @@
-from typepigeon.to_json import to_json
-from typepigeon.to_type import to_type
+from typepigeon.aio import async_to_json, async_to_type
+from typepigeon.arrays import to_array
+from typepigeon.converters import register_converter
+from typepigeon.from_json import iter_typed, load_typed
+from typepigeon.parallel import to_type_parallel
+from typepigeon.profiling import profile_conversions
+from typepigeon.to_json import dump_json, iter_json, to_json
+from typepigeon.to_type import ConversionErrors, compile_converter, to_type, to_type_many
 from typepigeon.types import subscripted_type
 
 __all__ = [
-    "to_type",
-    "to_json",
+    "ConversionErrors",
+    "async_to_json",
+    "async_to_type",
+    "compile_converter",
+    "dump_json",
+    "iter_json",
+    "iter_typed",
+    "load_typed",
+    "profile_conversions",
+    "register_converter",
     "subscripted_type",
+    "to_array",
+    "to_json",
+    "to_type",
+    "to_type_many",
+    "to_type_parallel",
 ]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Mapping
+
+from typepigeon.to_json import to_json
+from typepigeon.to_type import to_type
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# values containing more entries than this (counting the entries of nested collections) are converted in an executor,
+# so that converting them does not block the event loop; smaller values are converted directly in the event loop
+ASYNC_INLINE_ENTRIES = 1000
+
+
+async def async_to_type(
+    input_value: Any,
+    output_type: type | Collection[type],
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Convert a value to the specified type (see ``to_type()``) without blocking the event loop on large values.
+
+    Values with more than ``ASYNC_INLINE_ENTRIES`` entries are converted in the given executor (the default executor
+    of the event loop by default); smaller values are converted directly, since handing them to an executor costs more
+    than converting them.
+
+    :param input_value: Python value
+    :param output_type: type to convert to
+    :param executor: executor to convert large values in
+    :param kwargs: keyword arguments of ``to_type()`` (such as ``errors`` or ``copy``)
+    :return: converted value
+
+    >>> await async_to_type(['1', '2.5'], [float])
+    [1.0, 2.5]
+    >>> await async_to_type(['1', 'a'], [float], errors='coerce')
+    [1.0, None]
+    """
+    if not _exceeds_entries(input_value, ASYNC_INLINE_ENTRIES):
+        return to_type(input_value, output_type, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(to_type, input_value, output_type, **kwargs))
+
+
+async def async_to_json(input_value: Any, executor: Executor | None = None, **kwargs: Any) -> Any:
+    """Convert the given value to a JSON-compatible format (see ``to_json()``) without blocking the event loop on large values.
+
+    Values with more than ``ASYNC_INLINE_ENTRIES`` entries are converted in the given executor (the default executor
+    of the event loop by default); smaller values are converted directly.
+
+    :param input_value: value to convert
+    :param executor: executor to convert large values in
+    :param kwargs: keyword arguments of ``to_json()`` (such as ``bytes_encoding`` or ``copy``)
+    :return: JSON value
+
+    >>> await async_to_json({'test': [5, '6', {3: datetime(2021, 3, 27)}]})
+    {'test': [5, '6', {3: '2021-03-27 00:00:00'}]}
+    """
+    if not _exceeds_entries(input_value, ASYNC_INLINE_ENTRIES):
+        return to_json(input_value, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(to_json, input_value, **kwargs))
+
+
+def _exceeds_entries(input_value: Any, limit: int) -> bool:
+    """Whether the given value contains more than the given number of entries, counting the entries of nested collections.
+
+    Strings and binary data count as one entry per ``_CHARACTERS_PER_ENTRY`` characters (bytes), since they may be split
+    into collections; iterators, whose length is unknown, always exceed the limit. Only as many collections are visited
+    as are needed to reach the limit.
+    """
+    entries = 0
+    stack = [input_value]
+    while len(stack) > 0:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type in _SCALAR_TYPES:
+            continue
+        if value_type is str:
+            entries += len(value) // _CHARACTERS_PER_ENTRY
+        elif value_type is list or value_type is tuple:
+            entries += len(value)
+            if entries <= limit:
+                stack.extend(value)
+        elif value_type is dict:
+            entries += len(value)
+            if entries <= limit:
+                stack.extend(value.values())
+        elif isinstance(value, (str, bytes, bytearray, memoryview)):
+            entries += len(value) // _CHARACTERS_PER_ENTRY
+        elif isinstance(value, Collection):
+            entries += len(value)
+            if entries <= limit:
+                stack.extend(value.values() if isinstance(value, Mapping) else value)
+        elif isinstance(value, Iterable):
+            return True
+        if entries > limit:
+            return True
+    return False
+
+
+# types of values without entries, which are skipped without further checks
+_SCALAR_TYPES = frozenset((int, float, bool, type(None)))
+
+
+# approximate number of characters of each entry of a collection given as a string (such as `'1, 2, 3'`)
+_CHARACTERS_PER_ENTRY = 8
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Collection
+
+from typepigeon.backends import backend_available, backend_loaded, optional_backend
+from typepigeon.spatial import vectorized_geometries
+from typepigeon.temporal import _vectorized_timedelta_microseconds, format_timedeltas
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Python lists shorter than this are converted element by element, since building an array costs more than it saves
+MINIMUM_VECTORIZED_LENGTH = 1000
+
+_VECTORIZED_DTYPES = {bool: "bool", int: "int64", float: "float64", str: "str", timedelta: "timedelta64[us]"}
+
+# formats of buffers (``bytes``, ``bytearray``, or ``memoryview``) whose elements NumPy converts exactly as ``to_type()`` does;
+# booleans are not integers to ``to_type()``, and single-precision floats are formatted as strings differently by NumPy
+_VECTORIZED_BUFFER_FORMATS = frozenset("bBhHiIlLqQd")
+
+
+def vectorizable(input_value: Any) -> bool:
+    """Whether the given collection is worth converting in a single NumPy operation (see ``vectorized_conversion()``).
+
+    :param input_value: collection of values
+    :return: whether the collection is a NumPy array, or a long list, tuple, or buffer and NumPy is installed
+    """
+    if isinstance(input_value, (list, tuple, bytes, bytearray, memoryview)):
+        return len(input_value) >= MINIMUM_VECTORIZED_LENGTH and backend_available("numpy")
+    return backend_loaded("numpy") and isinstance(input_value, optional_backend("numpy").ndarray)
+
+
+def _numeric_array(input_value: Collection, output_type: type) -> np.ndarray | None:
+    """Build a 1-dimensional array of numbers from the given collection, if converting that array is equivalent to converting each element."""
+    if backend_loaded("numpy") and isinstance(input_value, optional_backend("numpy").ndarray):
+        array = input_value
+    elif isinstance(input_value, (bytes, bytearray, memoryview)):
+        array = _buffer_array(input_value)
+        if array is None:
+            return None
+    else:
+        element_types = set(map(type, input_value))
+        if (
+            not element_types
+            or not element_types <= {bool, int, float}
+            # mixed numbers are promoted to a common type, which changes their string representation
+            or (output_type is str and len(element_types) > 1)
+            # `bool` is a subclass of `int`, so `to_type(True, int)` is `True`
+            or (output_type is int and bool in element_types)
+        ):
+            return None
+        try:
+            array = optional_backend("numpy").asarray(input_value)
+        except OverflowError:
+            return None
+
+    if array.ndim != 1 or array.dtype.kind not in "biuf":
+        return None
+    return array
+
+
+def _buffer_array(input_value: bytes | bytearray | memoryview) -> np.ndarray | None:
+    """View the elements of a buffer (bytes for ``bytes``, or the typed elements of a ``memoryview``) as a NumPy array, without copying them."""
+    view = memoryview(input_value)
+    if view.format not in _VECTORIZED_BUFFER_FORMATS:
+        return None
+    return optional_backend("numpy").asarray(view)
+
+
+def _timedelta_conversion(input_value: Collection, output_type: type) -> np.ndarray | None:
+    """Parse a sequence of timedelta strings to ``timedelta64``, or format a sequence of timedeltas as strings, in a single pass."""
+    if not isinstance(input_value, (list, tuple)):
+        return None
+    if output_type is timedelta:
+        microseconds = _vectorized_timedelta_microseconds(input_value)
+        return microseconds.astype("timedelta64[us]") if microseconds is not None else None
+    if len(input_value) > 0 and all(type(entry) is timedelta for entry in input_value):
+        return optional_backend("numpy").asarray(format_timedeltas(input_value))
+    return None
+
+
+def vectorized_conversion(input_value: Collection, output_type: type) -> np.ndarray | None:
+    """Convert a homogeneous sequence (or 1-dimensional NumPy array or buffer) of numbers to the given type in a single NumPy operation.
+
+    Sequences of timedelta strings (``[[DD:]HH:]MM:SS``) are likewise parsed to ``timedelta``, and sequences of timedeltas formatted to ``str``;
+    sequences of encoded geometries are parsed to Shapely geometry types with ``vectorized_geometries()``.
+    Only conversions that produce exactly the same values as converting each element with ``to_type()`` are vectorized.
+
+    :param input_value: sequence of numbers, timedelta strings or timedeltas, or encoded geometries, a NumPy array, or ``bytes``, ``bytearray``, or ``memoryview``
+    :param output_type: one of ``bool``, ``int``, ``float``, ``str``, ``timedelta``, or a Shapely geometry type
+    :return: converted array, or ``None`` if NumPy is not installed or the conversion cannot be vectorized
+    """
+    if (
+        backend_loaded("shapely")
+        and isinstance(output_type, type)
+        and issubclass(output_type, optional_backend("shapely").BaseGeometry)
+    ):
+        return vectorized_geometries(input_value, output_type)
+    if output_type not in _VECTORIZED_DTYPES or not backend_available("numpy"):
+        return None
+    if output_type in (timedelta, str):
+        array = _timedelta_conversion(input_value, output_type)
+        if array is not None or output_type is timedelta:
+            return array
+
+    array = _numeric_array(input_value, output_type)
+    if array is not None and output_type is int:
+        if array.dtype.kind in "iu":
+            return array.copy()
+        if array.dtype.kind == "f" and not (optional_backend("numpy").isfinite(array).all() and (abs(array) < 2.0**63).all()):
+            array = None
+    if array is not None:
+        array = array.astype(_VECTORIZED_DTYPES[output_type])
+    return array
+
+
+def to_array(input_value: Any, output_type: type | Collection[type]) -> np.ndarray:
+    """Convert a sequence of values to a NumPy array of the given element type.
+
+    Sequences of numbers (and NumPy arrays) are converted in a single vectorized operation;
+    anything else is converted element by element with ``to_type()``.
+
+    :param input_value: sequence of values
+    :param output_type: element type (``float``) or homogeneous list type (``[float]``)
+    :return: NumPy array
+
+    >>> to_array([1, 2, 3], float)
+    array([1., 2., 3.])
+    >>> to_array(['1', '2', '3'], [int])
+    array([1, 2, 3])
+    """
+    from typepigeon.to_type import to_type
+
+    numpy = optional_backend("numpy")
+    if numpy is None:
+        msg = "`to_array()` requires NumPy"
+        raise ImportError(msg)
+
+    if isinstance(output_type, list) and len(output_type) == 1:
+        output_type = output_type[0]
+
+    array = vectorized_conversion(input_value, output_type)
+    if array is None:
+        array = numpy.asarray(to_type(input_value, [output_type]))
+    return array
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from importlib.util import find_spec
+from types import SimpleNamespace
+from typing import Callable
+
+
+def _load_dateutil() -> SimpleNamespace:
+    from dateutil.parser import parse
+
+    return SimpleNamespace(parse=parse)
+
+
+def _load_numpy() -> SimpleNamespace:
+    import numpy as np
+
+    return SimpleNamespace(ndarray=np.ndarray, asarray=np.asarray, isfinite=np.isfinite, modf=np.modf)
+
+
+def _load_pyproj() -> SimpleNamespace:
+    from pyproj import CRS
+
+    return SimpleNamespace(CRS=CRS)
+
+
+def _load_shapely() -> SimpleNamespace:
+    import shapely
+    from shapely import wkb, wkt
+    from shapely.errors import GEOSException
+    from shapely.geometry import Point, Polygon, shape
+    from shapely.geometry.base import BaseGeometry
+
+    return SimpleNamespace(
+        wkb=wkb,
+        wkt=wkt,
+        GEOSException=GEOSException,
+        shape=shape,
+        BaseGeometry=BaseGeometry,
+        Point=Point,
+        Polygon=Polygon,
+        # array functions are only available in Shapely 2
+        **{name: getattr(shapely, name, None) for name in ("from_wkb", "from_wkt", "points", "polygons")},
+    )
+
+
+OPTIONAL_BACKENDS: dict[str, Callable[[], SimpleNamespace]] = {
+    "dateutil": _load_dateutil,
+    "numpy": _load_numpy,
+    "pyproj": _load_pyproj,
+    "shapely": _load_shapely,
+}
+
+
+@lru_cache(maxsize=None)
+def backend_available(name: str) -> bool:
+    """Whether the given optional backend can be imported, without importing it.
+
+    :param name: name of the backend module
+    :return: whether the module is installed
+
+    >>> backend_available('dateutil')
+    True
+    """
+    if name in sys.modules:
+        return True
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def optional_backend(name: str) -> SimpleNamespace | None:
+    """Import the given optional backend on first use, and retrieve its commonly-used symbols.
+
+    :param name: name of the backend module (one of ``OPTIONAL_BACKENDS``)
+    :return: namespace of symbols, or ``None`` if the backend is not installed
+
+    >>> optional_backend('pyproj').CRS
+    <class 'pyproj.crs.crs.CRS'>
+    """
+    if not backend_available(name):
+        return None
+    try:
+        return OPTIONAL_BACKENDS[name]()
+    except ImportError:
+        return None
+
+
+def backend_loaded(name: str) -> bool:
+    """Whether the given optional backend has already been imported (by anyone).
+
+    Values of a backend's types (such as a ``pyproj.CRS``) cannot exist unless the backend has already been imported,
+    so this check avoids importing backends that are installed but unused.
+
+    :param name: name of the backend module
+    :return: whether the module is imported
+    """
+    return name in sys.modules and optional_backend(name) is not None
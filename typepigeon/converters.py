@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import ast
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable
+
+from typepigeon import profiling
+from typepigeon.backends import backend_loaded, optional_backend
+from typepigeon.spatial import cached_crs, cached_crs_form
+from typepigeon.temporal import format_timedelta, parse_datetime, parse_timedelta
+
+Converter = Callable[[Any, type], Any]
+
+_CONVERTERS: dict[tuple[type, type], Converter] = {}
+_RESOLVED_CONVERTERS: dict[tuple[type, type], Converter] = {}
+
+
+def register_converter(source_type: type, output_type: type, converter: Converter):
+    """Register a function that converts values of the given source type (or its subclasses) to the given output type (or its subclasses).
+
+    The converter is called with the input value and the requested output type, and should return the converted value.
+    When looking up a converter, the most specific source type (by method resolution order) takes precedence,
+    followed by the most specific output type.
+
+    :param source_type: type of input values (use ``object`` to match any input)
+    :param output_type: type of output values
+    :param converter: function accepting ``(input_value, output_type)``
+
+    >>> class Meters(float):
+    ...     pass
+    >>> register_converter(str, Meters, lambda value, output_type: output_type(value.rstrip('m')))
+    >>> to_type('5m', Meters)
+    5.0
+    """
+    _CONVERTERS[(source_type, output_type)] = converter
+    _RESOLVED_CONVERTERS.clear()
+
+
+def find_converter(source_type: type, output_type: type) -> Converter:
+    """Find the registered converter between the given source and output types, walking both MROs.
+
+    :param source_type: type of the input value
+    :param output_type: type to convert to
+    :return: converter accepting ``(input_value, output_type)``
+    """
+    try:
+        return _RESOLVED_CONVERTERS[(source_type, output_type)]
+    except KeyError:
+        pass
+
+    for backend in list(_BACKEND_CONVERTERS):
+        if backend_loaded(backend):
+            register_backend_converters = _BACKEND_CONVERTERS.pop(backend, None)
+            if register_backend_converters is not None:
+                register_backend_converters()
+
+    output_type_mro = getattr(output_type, "__mro__", (object,))
+    for current_source_type in source_type.__mro__:
+        for current_output_type in output_type_mro:
+            converter = _CONVERTERS.get((current_source_type, current_output_type))
+            if converter is not None:
+                _RESOLVED_CONVERTERS[(source_type, output_type)] = converter
+                return converter
+
+    # unreachable unless the default converter was removed
+    msg = f"no converter from {source_type} to {output_type}"
+    raise TypeError(msg)
+
+
+def convert_scalar(input_value: Any, output_type: type) -> Any:
+    """Convert a value (that is not ``None`` and not already of the given type) to a non-collection type.
+
+    :param input_value: Python value
+    :param output_type: type to convert to
+    :return: converted value
+    """
+    converter = find_converter(type(input_value), output_type)
+    if profiling.ACTIVE_PROFILE is not None:
+        branch = getattr(converter, "__name__", "converter").lstrip("_")
+        return profiling.measure(profiling.ACTIVE_PROFILE, converter, input_value, output_type, branch, output_type)
+    return converter(input_value, output_type)
+
+
+def construct(input_value: Any, output_type: type) -> Any:
+    """Construct the output type from the given value, using ``output_type.from_string()`` for strings where available."""
+    if isinstance(input_value, (str, bytes)):
+        from_string = getattr(output_type, "from_string", None)
+        if from_string is not None:
+            try:
+                converted_value = from_string(input_value)
+            except AttributeError:
+                profiling.note_fallback()
+            else:
+                profiling.note_branch("from_string")
+                return converted_value
+    profiling.note_branch("constructor")
+    return output_type(input_value)
+
+
+def _finish(input_value: Any, output_type: type) -> Any:
+    if not isinstance(input_value, output_type):
+        input_value = construct(input_value, output_type)
+    return input_value
+
+
+def _timedelta_to_str(input_value: timedelta, output_type: type) -> Any:
+    return _finish(format_timedelta(input_value), output_type)
+
+
+def _timedelta_to_object(input_value: timedelta, output_type: type) -> Any:
+    seconds = input_value / timedelta(seconds=1)
+    if type(seconds) is output_type:
+        return seconds
+    return convert_scalar(seconds, output_type)
+
+
+def _to_bool(input_value: Any, output_type: type) -> Any:
+    try:
+        input_value = ast.literal_eval(f"{input_value}")
+    except ValueError:
+        profiling.note_fallback()
+        input_value = bool(input_value)
+        profiling.note_branch("bool")
+    else:
+        profiling.note_branch("literal_eval")
+    return _finish(input_value, output_type)
+
+
+def _to_date(input_value: Any, output_type: type) -> Any:
+    if isinstance(input_value, str):
+        profiling.note_branch("parse_datetime")
+        input_value = parse_datetime(input_value)
+    else:
+        dateutil = optional_backend("dateutil")
+        if dateutil is not None:
+            profiling.note_branch("dateutil")
+            try:
+                input_value = dateutil.parse(input_value)
+            except TypeError:
+                profiling.note_fallback()
+    if issubclass(output_type, datetime) and isinstance(input_value, date) and not isinstance(input_value, datetime):
+        input_value = datetime.combine(input_value, time(0, 0, 0))
+    elif issubclass(output_type, date) and not issubclass(output_type, datetime):
+        input_value = input_value.date()
+    return _finish(input_value, output_type)
+
+
+def _to_timedelta(input_value: Any, output_type: type) -> Any:
+    return _finish(parse_timedelta(input_value), output_type)
+
+
+def _crs_to_str(input_value: Any, output_type: type) -> Any:
+    return _finish(cached_crs_form(input_value, "to_wkt"), output_type)
+
+
+def _crs_to_dict(input_value: Any, output_type: type) -> Any:
+    return _finish(cached_crs_form(input_value, "to_json_dict"), output_type)
+
+
+def _crs_to_int(input_value: Any, output_type: type) -> Any:
+    return _finish(cached_crs_form(input_value, "to_epsg"), output_type)
+
+
+def _to_crs(input_value: Any, output_type: type) -> Any:
+    return cached_crs(input_value, output_type, _finish)
+
+
+def _to_geometry(input_value: Any, output_type: type) -> Any:
+    shapely = optional_backend("shapely")
+    geometry = None
+    if isinstance(input_value, (bytes, bytearray, memoryview)):
+        # Shapely only reads WKB from `bytes`
+        input_value = bytes(input_value)
+        if input_value[:1] in (b"\x00", b"\x01"):
+            # binary WKB starts with its byte order (0 or 1), which neither hexadecimal WKB nor WKT can start with
+            try:
+                geometry = shapely.wkb.loads(input_value)
+                profiling.note_branch("wkb")
+            except (TypeError, shapely.GEOSException):
+                profiling.note_fallback()
+    if geometry is None:
+        geometry = _parse_geometry(input_value, output_type, shapely)
+    return _finish(geometry, output_type)
+
+
+def _parse_geometry(input_value: Any, output_type: type, shapely: object) -> Any:
+    try:
+        input_value = shapely.wkb.loads(input_value, hex=True)
+        profiling.note_branch("wkb_hex")
+    except:
+        profiling.note_fallback()
+        try:
+            input_value = shapely.wkt.loads(input_value)
+            profiling.note_branch("wkt")
+        except:
+            profiling.note_fallback()
+            try:
+                input_value = shapely.wkb.loads(input_value)
+                profiling.note_branch("wkb")
+            except (TypeError, shapely.GEOSException):
+                profiling.note_fallback()
+                if isinstance(input_value, str):
+                    input_value = ast.literal_eval(input_value)
+                try:
+                    input_value = shapely.shape(input_value)
+                    profiling.note_branch("shape")
+                except:
+                    profiling.note_fallback()
+                    input_value = output_type(input_value)
+                    profiling.note_branch("constructor")
+    return input_value
+
+
+def _register_pyproj_converters():
+    crs_type = optional_backend("pyproj").CRS
+    register_converter(crs_type, str, _crs_to_str)
+    register_converter(crs_type, dict, _crs_to_dict)
+    register_converter(crs_type, int, _crs_to_int)
+    register_converter(object, crs_type, _to_crs)
+
+
+def _register_shapely_converters():
+    register_converter(object, optional_backend("shapely").BaseGeometry, _to_geometry)
+
+
+# converters of optional backends are only registered once the backend is imported
+_BACKEND_CONVERTERS: dict[str, Callable[[], None]] = {
+    "pyproj": _register_pyproj_converters,
+    "shapely": _register_shapely_converters,
+}
+
+register_converter(object, object, _finish)
+register_converter(object, bool, _to_bool)
+register_converter(object, date, _to_date)
+register_converter(object, timedelta, _to_timedelta)
+register_converter(timedelta, str, _timedelta_to_str)
+register_converter(timedelta, object, _timedelta_to_object)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from enum import Enum, EnumMeta
+
+
+class EnumIndex:
+    """Lookup tables of the members of an enumeration, built once by ``enum_index()``.
+
+    ``members`` finds a member by its name (including aliases) or its value, preferring names as ``Enum.__getitem__()`` does;
+    ``casefolded`` finds a member by its case-folded name, for names that identify a single member when case is ignored;
+    ``names`` gives the name of each member by the ID of the member (members are singletons, and hashing by ID is cheaper
+    than ``Enum.__hash__()``).
+    """
+
+    __slots__ = ("casefolded", "enum_type", "members", "names")
+
+    def __init__(self, enum_type: EnumMeta):
+        members: dict[Any, Enum] = {}
+        for member in enum_type.__members__.values():
+            try:
+                members.setdefault(member.value, member)
+            except TypeError:
+                # unhashable values are left to the constructor of the enumeration
+                pass
+        members.update(enum_type.__members__)
+
+        casefolded: dict[str, Enum | None] = {}
+        for name, member in enum_type.__members__.items():
+            key = name.casefold()
+            # names that differ only in case, and belong to different members, are ambiguous
+            casefolded[key] = member if casefolded.get(key, member) is member else None
+
+        self.enum_type = enum_type
+        self.members = members
+        self.casefolded = {name: member for name, member in casefolded.items() if member is not None}
+        self.names = {id(member): member.name for member in enum_type.__members__.values()}
+
+    def __reduce__(self) -> tuple:
+        # member IDs differ between processes, so the index is rebuilt when unpickled (such as in worker processes)
+        return enum_index, (self.enum_type,)
+
+
+def enum_index(enum_type: EnumMeta) -> EnumIndex:
+    """Find the lookup tables of the members of the given enumeration, building them on first use.
+
+    :param enum_type: enumeration
+    :return: lookup tables of the members of the enumeration
+
+    >>> from enum import Enum
+    >>> class Color(Enum):
+    ...     RED = 1
+    ...     CRIMSON = 1
+    >>> index = enum_index(Color)
+    >>> index.members['CRIMSON'], index.members[1], index.casefolded['red']
+    (<Color.RED: 1>, <Color.RED: 1>, <Color.RED: 1>)
+    """
+    index = _ENUM_INDEXES.get(enum_type)
+    if index is None:
+        index = EnumIndex(enum_type)
+        _ENUM_INDEXES[enum_type] = index
+    return index
+
+
+# lookup tables of each enumeration encountered so far
+_ENUM_INDEXES: dict[EnumMeta, EnumIndex] = {}
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import IO, Any, Collection, Iterator
+
+from typepigeon.to_type import _cached_converter, _SequencePlan
+
+# number of characters to read from the file at a time in ``iter_typed()``; more are read at once for larger records
+READ_CHUNK_SIZE = 65536
+
+
+def iter_typed(fp: IO[str], record_type: type | Collection[type]) -> Iterator:
+    """Read JSON records one at a time from a text file (or any object with a ``read()`` method), and convert each to the given type.
+
+    The file may contain a single JSON array of records, or newline-delimited JSON (NDJSON, one record per line;
+    any whitespace may separate records); a file starting with ``[`` is read as a single array, so the records of an
+    NDJSON file cannot themselves be arrays.
+    The file is read in chunks of ``READ_CHUNK_SIZE`` characters, so only the current record (and the unread part
+    of the chunk) is held in memory; the type is resolved once for all records.
+
+    :param fp: readable text stream
+    :param record_type: type to convert each record to
+    :return: iterator over converted records
+
+    >>> from io import StringIO
+    >>> list(iter_typed(StringIO('{"a": "1"} {"b": 2.5}'), {str: float}))
+    [{'a': 1.0}, {'b': 2.5}]
+    >>> list(iter_typed(StringIO('["2021-03-26", "2021-03-27"]'), datetime))
+    [datetime.datetime(2021, 3, 26, 0, 0), datetime.datetime(2021, 3, 27, 0, 0)]
+    """
+    return map(_cached_converter(record_type), _iter_json_values(fp))
+
+
+def load_typed(fp: IO[str], output_type: type | Collection[type]) -> Any:
+    """Read a JSON file (or NDJSON file, as a list of records) and convert it to the given type.
+
+    If the type is a homogeneous sequence (such as ``[Record]``), records are read and converted one at a time with
+    ``iter_typed()``, so the unconverted records are never all held in memory; otherwise, the whole file is loaded
+    with ``json.load()`` and then converted.
+
+    :param fp: readable text stream
+    :param output_type: type to convert the file contents to
+    :return: converted value
+
+    >>> from io import StringIO
+    >>> load_typed(StringIO('[{"a": "1"}, {"b": 2.5}]'), [{str: float}])
+    [{'a': 1.0}, {'b': 2.5}]
+    """
+    converter = _cached_converter(output_type)
+    if type(converter) is _SequencePlan and len(converter.element_plans) == 1:
+        values = list(map(converter.element_plans[0], _iter_json_values(fp)))
+        return values if converter.collection_type is list else converter.collection_type(values)
+    return converter(json.load(fp))
+
+
+def _iter_json_values(fp: IO[str]) -> Iterator[Any]:
+    """Parse the entries of a JSON array, or the values of an NDJSON file, incrementally."""
+    stream = _JsonStream(fp)
+    if stream.next_character() == "[":
+        stream.position += 1
+        if stream.next_character() == "]":
+            stream.position += 1
+        else:
+            while True:
+                stream.next_character()
+                yield stream.decode()
+                delimiter = stream.next_character()
+                stream.position += 1
+                if delimiter == "]":
+                    break
+                if delimiter != ",":
+                    msg = "Expecting ',' delimiter"
+                    raise json.JSONDecodeError(msg, stream.buffer, stream.position - 1)
+        if stream.next_character() != "":
+            msg = "Extra data after array (records of NDJSON files cannot be arrays)"
+            raise json.JSONDecodeError(msg, stream.buffer, stream.position)
+    else:
+        while stream.next_character() != "":
+            yield stream.decode()
+
+
+class _JsonStream:
+    """Buffer of the unparsed characters of a text stream, read in chunks."""
+
+    __slots__ = ("buffer", "decoder", "end_of_file", "fp", "position", "read_size")
+
+    def __init__(self, fp: IO[str]):
+        self.fp = fp
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.end_of_file = False
+        self.read_size = READ_CHUNK_SIZE
+
+    def next_character(self) -> str:
+        """Skip whitespace, and return the next character without consuming it (or an empty string at the end of the file)."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.position)
+            if match is not None:
+                self.position = match.start()
+                return match.group()
+            self.position = len(self.buffer)
+            if not self._read():
+                return ""
+
+    def decode(self) -> Any:
+        """Parse the JSON value starting at the current position, reading further chunks until it is complete."""
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.end_of_file:
+                    raise
+            else:
+                # a number that reaches the end of the buffer, or is followed by the start of an exponent or fraction,
+                # may continue in the next chunk
+                if self.end_of_file or (end < len(self.buffer) and self.buffer[end] not in _NUMBER_CHARACTERS):
+                    self.position = end
+                    return value
+            # read at least as many characters as are already pending, so that large values are not parsed too many times
+            self.read_size = max(self.read_size, len(self.buffer) - self.position)
+            self._read()
+
+    def _read(self) -> bool:
+        """Append the next chunk of the file to the unparsed characters, or return ``False`` at the end of the file."""
+        chunk = self.fp.read(self.read_size)
+        if len(chunk) == 0:
+            self.end_of_file = True
+            return False
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+# characters that may continue a number, which never directly follow a complete JSON value
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Collection, Mapping
+
+from typepigeon.arrays import vectorizable, vectorized_conversion
+from typepigeon.to_type import ConversionPlan, _cached_converter, _MappingPlan, _SequencePlan
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+# collections shorter than this are always converted in the current process
+PARALLEL_MINIMUM_LENGTH = 1000
+
+# number of leading entries converted in the current process to estimate the cost of converting each entry
+# (must be less than ``PARALLEL_MINIMUM_LENGTH``)
+PARALLEL_SAMPLE_LENGTH = 64
+
+# estimated time (in seconds) of converting the remaining entries below which starting worker processes is not worth it
+PARALLEL_MINIMUM_SECONDS = 0.2
+
+# estimated time (in seconds) of converting each chunk in a worker process, large enough to outweigh sending the chunk
+PARALLEL_CHUNK_SECONDS = 0.05
+
+# minimum number of chunks per worker, so that workers finishing early can take on remaining chunks
+_CHUNKS_PER_WORKER = 4
+
+
+def to_type_parallel(
+    input_value: Any,
+    output_type: type | Collection[type],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> Any:
+    """Convert a large list, tuple, or mapping to the specified collection type, converting chunks of its entries in a pool of worker processes.
+
+    The result is the same as ``to_type(input_value, output_type)``. Only homogeneous collection types (such as ``[datetime]``
+    or ``{str: Polygon}``) are split into chunks; anything else, and collections shorter than ``PARALLEL_MINIMUM_LENGTH``,
+    is converted in the current process. Unless a chunk size is given, the first ``PARALLEL_SAMPLE_LENGTH`` entries are
+    converted in the current process to estimate the cost of each entry, and the remaining entries are only sent to worker
+    processes if converting them is estimated to take longer than ``PARALLEL_MINIMUM_SECONDS``, in chunks estimated to take
+    ``PARALLEL_CHUNK_SECONDS`` each.
+
+    The compiled conversion plan is pickled and sent to the worker processes. Converters registered with
+    ``register_converter()`` are only available in workers started with the ``fork`` start method, which copy the current
+    process; workers started with ``spawn`` or ``forkserver`` (the default on Linux since Python 3.14) import ``typepigeon``
+    anew. To use registered converters, pass ``mp_context=multiprocessing.get_context('fork')`` where it is available.
+
+    :param input_value: list, tuple, or mapping of values
+    :param output_type: type to convert to
+    :param workers: number of worker processes (the number of CPUs by default)
+    :param chunk_size: number of entries in each chunk (estimated from the cost of converting the first entries by default)
+    :param mp_context: multiprocessing context with which to start the worker processes (the default start method by default)
+    :return: converted value
+
+    >>> to_type_parallel([f'2021-03-{day % 28 + 1:02}' for day in range(100000)], [datetime])[:2]
+    [datetime.datetime(2021, 3, 1, 0, 0), datetime.datetime(2021, 3, 2, 0, 0)]
+    """
+    plan = _cached_converter(output_type)
+    if workers is None:
+        workers = _available_cpus()
+
+    entries = _parallel_entries(input_value, plan)
+    if entries is None or workers < 2 or len(entries) < PARALLEL_MINIMUM_LENGTH:
+        return plan(input_value)
+
+    if type(plan) is _SequencePlan and plan.vectorized_type is not None and vectorizable(entries):
+        # conversions that NumPy does in a single operation are faster in the current process
+        converted_array = vectorized_conversion(entries, plan.vectorized_type)
+        if converted_array is not None:
+            return _assemble(plan, [converted_array.tolist()])
+
+    sample_values = []
+    if chunk_size is None:
+        # the first entry is converted separately, since it may resolve and cache converters
+        sample_values = _convert_chunk(plan, entries[:1])
+        start = perf_counter()
+        sample_values += _convert_chunk(plan, entries[1 : PARALLEL_SAMPLE_LENGTH + 1])
+        seconds_per_entry = (perf_counter() - start) / PARALLEL_SAMPLE_LENGTH
+        entries = entries[PARALLEL_SAMPLE_LENGTH + 1 :]
+
+        if seconds_per_entry * len(entries) < PARALLEL_MINIMUM_SECONDS:
+            return _assemble(plan, [sample_values, _convert_chunk(plan, entries)])
+        chunk_size = min(
+            math.ceil(PARALLEL_CHUNK_SECONDS / seconds_per_entry),
+            math.ceil(len(entries) / (workers * _CHUNKS_PER_WORKER)),
+        )
+    chunk_size = max(chunk_size, 1)
+
+    chunks = [entries[index : index + chunk_size] for index in range(0, len(entries), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=mp_context) as executor:
+        converted_chunks = list(executor.map(partial(_convert_chunk, plan), chunks))
+    return _assemble(plan, [sample_values, *converted_chunks])
+
+
+def _available_cpus() -> int:
+    """Count the CPUs that the current process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # `os.sched_getaffinity()` is not available on macOS or Windows
+        return os.cpu_count() or 1
+
+
+def _parallel_entries(input_value: Any, plan: ConversionPlan) -> list | None:
+    """Retrieve the entries of a collection (``(key, value)`` pairs for a mapping) to split into chunks, or ``None`` if the conversion cannot be split."""
+    entries = None
+    if type(plan) is _SequencePlan and len(plan.element_plans) == 1 and isinstance(input_value, (list, tuple)):
+        entries = input_value
+    elif type(plan) is _MappingPlan and plan.key_plan is not None and isinstance(input_value, Mapping):
+        entries = list(input_value.items())
+    return entries
+
+
+def _convert_chunk(plan: ConversionPlan, entries: list | tuple) -> list:
+    """Convert a chunk of entries of a collection (``(key, value)`` pairs for a mapping) with the plan of the collection."""
+    if type(plan) is _MappingPlan:
+        key_plan = plan.key_plan
+        value_plan = plan.value_plan
+        return [(key_plan(key), value_plan(value)) for key, value in entries]
+    return list(plan(entries))
+
+
+def _assemble(plan: ConversionPlan, converted_chunks: list[list]) -> Any:
+    """Join converted chunks, in order, into the output collection of the plan."""
+    converted_values = list(chain.from_iterable(converted_chunks))
+    if plan.collection_type is list:
+        return converted_values
+    return plan.collection_type(converted_values)
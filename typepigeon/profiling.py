@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Iterator, Mapping, NamedTuple
+
+# profile that conversions are currently recorded to, or ``None`` if profiling is disabled;
+# instrumented code only checks this attribute, so disabled profiling costs a single comparison per conversion
+ACTIVE_PROFILE: ConversionProfile | None = None
+
+_frames = threading.local()
+
+
+class BranchStats(NamedTuple):
+    calls: int
+    seconds: float
+    fallbacks: int
+    errors: int
+
+
+class ConversionProfile:
+    """Call counts, cumulative time, and fallback counts of conversions, per ``(input type, output type, branch)``.
+
+    Times are inclusive: the time of converting a collection includes the time of converting its elements,
+    which are also recorded under their own types.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, input_type: type, output_type: Any, branch: str, seconds: float, *, fallbacks: int = 0, error: bool = False
+    ):
+        """Add a single conversion to the profile.
+
+        :param input_type: type of the input value
+        :param output_type: type (or collection of types) converted to
+        :param branch: name of the conversion branch that produced the result
+        :param seconds: time taken by the conversion
+        :param fallbacks: number of failed attempts (caught exceptions) before the branch that succeeded
+        :param error: whether the conversion raised an exception
+        """
+        key = (type_name(input_type), type_name(output_type), branch)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = [0, 0.0, 0, 0]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += fallbacks
+            stats[3] += error
+
+    def stats(self) -> dict[tuple[str, str, str], BranchStats]:
+        """Retrieve the recorded statistics, keyed by ``(input type, output type, branch)`` names.
+
+        :return: statistics of each branch
+        """
+        with self._lock:
+            return {key: BranchStats(*stats) for key, stats in self._stats.items()}
+
+    def report(self, limit: int | None = None) -> str:
+        """Format the recorded statistics as a table, sorted by cumulative time.
+
+        :param limit: maximum number of rows
+        :return: table of statistics
+        """
+        rows = sorted(self.stats().items(), key=lambda item: item[1].seconds, reverse=True)[:limit]
+        header = ("input type", "output type", "branch", "calls", "total ms", "mean us", "fallbacks", "errors")
+        lines = [
+            (
+                input_type,
+                output_type,
+                branch,
+                str(stats.calls),
+                f"{stats.seconds * 1e3:.3f}",
+                f"{stats.seconds / stats.calls * 1e6:.2f}",
+                str(stats.fallbacks),
+                str(stats.errors),
+            )
+            for (input_type, output_type, branch), stats in rows
+        ]
+        widths = [max(len(line[index]) for line in [header, *lines]) for index in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if index < 3 else cell.rjust(width) for index, (cell, width) in enumerate(zip(line, widths))
+            )
+            for line in [header, *lines]
+        )
+
+    def reset(self):
+        """Remove all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+def enable_profiling(profile: ConversionProfile | None = None) -> ConversionProfile:
+    """Record all subsequent conversions (in any thread) to the given profile, until ``disable_profiling()`` is called.
+
+    :param profile: profile to record to (a new profile by default)
+    :return: active profile
+    """
+    global ACTIVE_PROFILE  # noqa: PLW0603
+
+    ACTIVE_PROFILE = profile if profile is not None else ConversionProfile()
+    return ACTIVE_PROFILE
+
+
+def disable_profiling():
+    """Stop recording conversions."""
+    global ACTIVE_PROFILE  # noqa: PLW0603
+
+    ACTIVE_PROFILE = None
+
+
+@contextmanager
+def profile_conversions(profile: ConversionProfile | None = None) -> Iterator[ConversionProfile]:
+    """Record conversions made within the context, and restore the previous profiling state afterward.
+
+    :param profile: profile to record to (a new profile by default)
+    :return: active profile
+
+    >>> with profile_conversions() as profile:
+    ...     to_type(['1', 'true', 'false'], [bool])
+    [True, True, False]
+    >>> profile.stats()[('str', 'bool', 'literal_eval')]
+    BranchStats(calls=3, seconds=..., fallbacks=0, errors=0)
+    """
+    global ACTIVE_PROFILE  # noqa: PLW0603
+
+    previous_profile = ACTIVE_PROFILE
+    ACTIVE_PROFILE = profile if profile is not None else ConversionProfile()
+    try:
+        yield ACTIVE_PROFILE
+    finally:
+        ACTIVE_PROFILE = previous_profile
+
+
+def measure(
+    profile: ConversionProfile,
+    conversion: Callable[..., Any],
+    input_value: Any,
+    output_type: Any,
+    branch: str,
+    *arguments: Any,
+) -> Any:
+    """Call the given conversion with the input value (and any further arguments), and record it to the profile.
+
+    The conversion may name the branch it takes with ``note_branch()`` and count fallbacks with ``note_fallback()``.
+
+    :param profile: profile to record to
+    :param conversion: conversion function
+    :param input_value: value to convert
+    :param output_type: type to convert to
+    :param branch: name of the branch, unless noted otherwise during the conversion
+    :return: converted value
+    """
+    frames = _frames.__dict__.setdefault("stack", [])
+    frame = [branch, 0, False]
+    frames.append(frame)
+    error = False
+    start = perf_counter()
+    try:
+        return conversion(input_value, *arguments)
+    except BaseException:
+        error = True
+        raise
+    finally:
+        seconds = perf_counter() - start
+        frames.pop()
+        profile.record(type(input_value), output_type, frame[0], seconds, fallbacks=frame[1], error=error)
+
+
+def note_branch(branch: str):
+    """Name the branch taken by the conversion currently being measured (if profiling is enabled).
+
+    Only the first branch noted within a conversion is kept, so that generic steps shared by several converters
+    (such as calling the output type's constructor at the end) do not replace the more specific branch.
+    """
+    if ACTIVE_PROFILE is not None:
+        frames = getattr(_frames, "stack", None)
+        if frames and not frames[-1][2]:
+            frames[-1][0] = branch
+            frames[-1][2] = True
+
+
+def note_fallback():
+    """Count a failed attempt (caught exception) in the conversion currently being measured (if profiling is enabled)."""
+    if ACTIVE_PROFILE is not None:
+        frames = getattr(_frames, "stack", None)
+        if frames:
+            frames[-1][1] += 1
+
+
+def type_name(output_type: Any) -> str:
+    """Build a short, readable name of a type or type specification.
+
+    :param output_type: type or collection of types
+    :return: name
+
+    >>> type_name({str: [float]})
+    '{str: [float]}'
+    """
+    if isinstance(output_type, type):
+        return output_type.__qualname__
+    if isinstance(output_type, Mapping):
+        return f"{{{', '.join(f'{type_name(key)}: {type_name(value)}' for key, value in output_type.items())}}}"
+    if isinstance(output_type, (list, tuple, set)):
+        names = ", ".join(type_name(member) for member in output_type)
+        if isinstance(output_type, list):
+            return f"[{names}]"
+        if isinstance(output_type, tuple):
+            return f"({names})"
+        return f"{{{names}}}"
+    return repr(output_type)
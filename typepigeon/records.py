@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import types
+from typing import Any, Union, get_type_hints
+
+# type of `X | None` annotations (Python >= 3.10)
+_UNION_TYPE = getattr(types, "UnionType", None)
+
+
+def record_fields(output_type: Any) -> dict[str, Any] | None:
+    """Find the fields of a dataclass, ``NamedTuple``, or ``TypedDict``, and the types they are annotated with.
+
+    Annotations are resolved with ``typing.get_type_hints()`` where possible (including string annotations); an annotation
+    that cannot be resolved (such as a string naming a class that is not defined at module level) becomes ``Any``, without
+    affecting the other fields. ``Optional[X]`` becomes ``X``. The fields of a dataclass are the arguments of its
+    constructor, so fields with ``init=False`` are left out, and ``InitVar[X]`` pseudo-fields are included as ``X``.
+
+    :param output_type: class
+    :return: field types by field name, or ``None`` if the class is not a dataclass, ``NamedTuple``, or ``TypedDict``
+
+    >>> from typing import NamedTuple, Optional
+    >>> Station = NamedTuple('Station', [('name', str), ('elevation', Optional[float])])
+    >>> record_fields(Station)
+    {'name': <class 'str'>, 'elevation': <class 'float'>}
+    """
+    names = _field_names(output_type)
+    if names is None:
+        return None
+
+    try:
+        annotations = get_type_hints(output_type)
+    except (NameError, TypeError, SyntaxError):
+        # resolve each field on its own, so that one annotation that cannot be resolved does not affect the others
+        annotations = {}
+        for base in reversed(output_type.__mro__):
+            for name, annotation in getattr(base, "__annotations__", {}).items():
+                annotations[name] = _resolve_annotation(annotation, base, output_type)
+    return {name: _field_type(annotations.get(name, Any)) for name in names}
+
+
+def is_record_type(output_type: Any) -> bool:
+    """Whether the given type is a dataclass, ``NamedTuple``, or ``TypedDict``, whose fields can be converted with ``record_fields()``.
+
+    :param output_type: type
+    :return: whether the type is a dataclass, ``NamedTuple``, or ``TypedDict``
+    """
+    return _field_names(output_type) is not None
+
+
+def _field_names(output_type: Any) -> list[str] | None:
+    """Find the names of the fields of a dataclass, ``NamedTuple``, or ``TypedDict`` that can be passed to its constructor."""
+    names = None
+    if isinstance(output_type, type):
+        if dataclasses.is_dataclass(output_type):
+            # the arguments of `__init__()`: fields with `init=False` cannot be set from the input, and `InitVar` pseudo-fields
+            # (which are not in `dataclasses.fields()`) must be
+            names = list(inspect.signature(output_type).parameters)
+        elif issubclass(output_type, tuple) and hasattr(output_type, "_fields"):
+            names = list(output_type._fields)
+        elif issubclass(output_type, dict) and hasattr(output_type, "__total__"):
+            names = list(output_type.__annotations__)
+    return names
+
+
+def _resolve_annotation(annotation: Any, base: type, output_type: type) -> Any:
+    """Resolve a single annotation of the given base class of a record, or give ``Any`` if it cannot be resolved."""
+    # a class with only this annotation, defined in the module of the base, is resolved the same way as the base would be;
+    # the record class itself is also made available, so that records defined in functions can refer to themselves
+    field_class = type("_Field", (), {"__annotations__": {"field": annotation}, "__module__": base.__module__})
+    try:
+        return get_type_hints(field_class, localns={output_type.__name__: output_type, **vars(base)})["field"]
+    except (NameError, TypeError, SyntaxError):
+        return Any
+
+
+def _field_type(annotation: Any) -> Any:
+    """Reduce ``Optional[X]`` to ``X`` and ``InitVar[X]`` to ``X``; other unions, which cannot be converted to, become ``Any``."""
+    if isinstance(annotation, dataclasses.InitVar) or annotation is dataclasses.InitVar:
+        # `InitVar[X]` is the bare `InitVar` class before Python 3.8
+        annotation = getattr(annotation, "type", Any)
+    if getattr(annotation, "__origin__", None) is Union or (_UNION_TYPE is not None and isinstance(annotation, _UNION_TYPE)):
+        members = [member for member in annotation.__args__ if member is not type(None)]
+        annotation = members[0] if len(members) == 1 else Any
+    return annotation
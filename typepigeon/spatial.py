@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from string import hexdigits
+from typing import TYPE_CHECKING, Any, Callable, Collection, Hashable, Mapping, NamedTuple
+
+from typepigeon.backends import optional_backend
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# number of CRS objects (and of their WKT, EPSG, and JSON forms) to remember in ``cached_crs()`` and ``cached_crs_form()``
+CRS_CACHE_SIZE = 256
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _BoundedCache:
+    """Thread-safe mapping that evicts its least-recently-used entries beyond a maximum size, and counts hits and misses."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        # computed outside of the lock, so concurrent misses of the same key may each compute the value once
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CRS_CACHE = _BoundedCache(CRS_CACHE_SIZE)
+
+
+def cached_crs(input_value: Any, output_type: type, construct: Callable[[Any, type], Any]) -> Any:
+    """Construct a CRS from the given EPSG code, string (such as WKT), or JSON dictionary, reusing a previously-constructed CRS from the same input.
+
+    :param input_value: EPSG code, CRS string, or JSON dictionary
+    :param output_type: ``pyproj.CRS`` (or a subclass)
+    :param construct: function accepting ``(input_value, output_type)`` that constructs the CRS on a cache miss
+    :return: CRS
+    """
+    if isinstance(input_value, Mapping):
+        key = json.dumps(input_value, sort_keys=True, default=str)
+    elif type(input_value) in (int, str):
+        key = input_value
+    else:
+        return construct(input_value, output_type)
+    return _CRS_CACHE.get((output_type, type(input_value), key), lambda: construct(input_value, output_type))
+
+
+def cached_crs_form(crs: Any, method_name: str) -> Any:
+    """Retrieve the result of ``crs.to_wkt()``, ``crs.to_epsg()``, ``crs.to_json()``, or ``crs.to_json_dict()``, reusing the previous result for the same CRS object.
+
+    :param crs: ``pyproj.CRS`` object
+    :param method_name: name of the method to call
+    :return: WKT string, EPSG code, JSON string, or JSON dictionary
+    """
+    # CRS objects are hashed by their WKT, so they are keyed by identity; the object itself is kept in the entry so that its `id()` is not reused
+    if method_name == "to_json_dict":
+        # dictionaries are cached as JSON text, so that each caller receives its own copy
+        return json.loads(cached_crs_form(crs, "to_json"))
+    _, value = _CRS_CACHE.get((id(crs), method_name), lambda: (crs, getattr(crs, method_name)()))
+    return value
+
+
+def crs_cache_info() -> CacheInfo:
+    """Retrieve the hits, misses, and current size of the CRS cache used by ``to_type()`` and ``to_json()``.
+
+    :return: cache statistics, in the same form as ``functools.lru_cache().cache_info()``
+    """
+    return _CRS_CACHE.info()
+
+
+def clear_crs_cache():
+    """Remove all entries from the CRS cache, and reset its counters."""
+    _CRS_CACHE.clear()
+
+
+def vectorized_geometries(input_value: Collection, output_type: type) -> np.ndarray | None:
+    """Convert a homogeneous sequence of WKT strings, WKB bytes or hex strings, or coordinates to geometries in a single Shapely 2 operation.
+
+    The encoding is detected once for the whole sequence; the result is only returned if it is exactly what converting
+    each element with ``to_type()`` would produce.
+
+    :param input_value: sequence (or NumPy array) of encoded geometries, or of coordinates
+    :param output_type: geometry type, such as ``shapely.geometry.Polygon``
+    :return: array of geometries, or ``None`` if Shapely 2 is not installed or the conversion cannot be vectorized
+    """
+    shapely = optional_backend("shapely")
+    if shapely is None or shapely.from_wkt is None or optional_backend("numpy") is None:
+        return None
+
+    try:
+        geometries = _parse_geometries(input_value, output_type, shapely)
+    except (TypeError, ValueError, shapely.GEOSException):
+        geometries = None
+
+    if geometries is not None and not all(
+        geometry is None or isinstance(geometry, output_type) for geometry in geometries.tolist()
+    ):
+        geometries = None
+    return geometries
+
+
+def _parse_geometries(input_value: Collection, output_type: type, shapely: object) -> np.ndarray | None:
+    """Parse the given sequence with the Shapely array function matching the encoding of its first non-null element."""
+    numpy = optional_backend("numpy")
+    element_types = {type(entry) for entry in input_value} - {type(None)}
+    if len(element_types) != 1:
+        return None
+    element_type = element_types.pop()
+
+    geometries = None
+    if issubclass(element_type, (str, bytes)):
+        first_entry = next(entry for entry in input_value if entry is not None)
+        # `to_type()` tries hexadecimal WKB before WKT, and no WKT string is also valid hexadecimal
+        if isinstance(first_entry, bytes) or (
+            len(first_entry) > 0 and all(character in hexdigits for character in first_entry)
+        ):
+            geometries = shapely.from_wkb(numpy.asarray(input_value, dtype=object))
+        else:
+            geometries = shapely.from_wkt(numpy.asarray(input_value, dtype=object))
+    elif element_type in (tuple, list, numpy.ndarray) and output_type in (shapely.Point, shapely.Polygon):
+        coordinates = numpy.asarray(input_value)
+        if coordinates.dtype.kind in "iuf" and coordinates.shape[-1] in (2, 3):
+            if output_type is shapely.Point and coordinates.ndim == 2:
+                geometries = shapely.points(coordinates)
+            elif output_type is shapely.Polygon and coordinates.ndim == 3:
+                geometries = shapely.polygons(coordinates)
+    return geometries
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+
+# literals whose value is known without evaluating them; anything else (escapes, complex numbers, underscores in numbers,
+# nested collections) is left to `ast.literal_eval()`
+_NUMBER = r"[+-]?(?:(?:0+|[1-9][0-9]*)(?![0-9.eE_])|(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?(?![0-9_])|[0-9]+[eE][+-]?[0-9]+(?![0-9_]))"
+_QUOTED = r"'[^'\\\n\r\0\ud800-\udfff]*'|\"[^\"\\\n\r\0\ud800-\udfff]*\""
+_KEYWORD = r"(?:True|False|None)(?![A-Za-z0-9_])"
+_ELEMENT = rf"[ \t]*(?:{_NUMBER}|{_QUOTED}|{_KEYWORD})[ \t]*"
+
+_LITERAL_SEQUENCE = re.compile(rf"(?:{_ELEMENT}(?:,{_ELEMENT})*)?")
+_INTEGER_CHARACTERS = re.compile(r"[0-9, \t+-]*")
+_LEADING_ZEROS = re.compile(r"(?<![0-9])0+[1-9]")
+_LITERAL_ELEMENT = re.compile(rf"[ \t]*({_NUMBER}|{_QUOTED}|{_KEYWORD})[ \t]*(?:,|$)")
+
+# a value starting with an identifier (other than `True`, `False`, or `None`) is a name, which `ast.literal_eval()` rejects;
+# this only holds if nothing in the string can hide the name in a string, comment, or continuation line
+_NAME_ELEMENT = re.compile(rf"(?:^|,)[ \t]*(?!{_KEYWORD})[A-Za-z_]")
+_OPAQUE_CHARACTERS = re.compile(r"['\"#\\()\[\]{}]")
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+_KEYWORDS = {"True": True, "False": False, "None": None}
+
+
+def split_collection_string(string: str) -> list | tuple | None:
+    """Split a string into a collection of entries in a single pass, exactly as ``ast.literal_eval()`` followed by the fallback of splitting on newlines or commas would.
+
+    Handles flat bracketed or bare sequences of numbers, quoted strings without escapes, and ``True`` / ``False`` / ``None``
+    (as ``ast.literal_eval()`` would evaluate them), and comma- or newline-separated plain values (which
+    ``ast.literal_eval()`` would reject, and which are split into stripped strings).
+
+    :param string: string to split
+    :return: list or tuple of entries, or ``None`` if the string needs ``ast.literal_eval()`` to be interpreted
+
+    >>> split_collection_string('[1, 2.5, "a"]')
+    [1, 2.5, 'a']
+    >>> split_collection_string('1, 2')
+    (1, 2)
+    >>> split_collection_string('a, b, 3')
+    ['a', 'b', '3']
+    >>> split_collection_string('[[1, 2], [3]]') is None
+    True
+    """
+    if "\n" in string or "\r" in string:
+        return _split_lines(string)
+
+    stripped = string.strip(" \t")
+    collection_type = tuple
+    if stripped[:1] == "[" and stripped[-1:] == "]":
+        collection_type = list
+        body = stripped[1:-1]
+    elif stripped[:1] == "(" and stripped[-1:] == ")":
+        body = stripped[1:-1]
+    else:
+        body = string
+
+    entries = _literal_elements(body) if body.strip(" \t") != "" else []
+    if entries is not None:
+        if body is string and len(entries) < 2:
+            # `ast.literal_eval()` gives a single value rather than a collection, which is then used as the only entry;
+            # a single quoted string is instead a collection of characters
+            entries = [string.strip()] if len(entries) == 0 or not isinstance(entries[0], str) else None
+        elif collection_type is tuple and len(entries) == 1:
+            # a parenthesized single value is not a tuple
+            entries = None
+        else:
+            entries = collection_type(entries)
+    elif body is string and _OPAQUE_CHARACTERS.search(string) is None and _NAME_ELEMENT.search(string) is not None:
+        entries = [entry.strip() for entry in (string.split(",") if "," in string else [string])]
+    return entries
+
+
+def _literal_elements(body: str) -> list | None:
+    """Evaluate the elements of a comma-separated sequence of literals, or give ``None`` if it is not one."""
+    if _INTEGER_CHARACTERS.fullmatch(body) is not None and _LEADING_ZEROS.search(body) is None:
+        # `int()` rejects everything in these characters that is not an integer literal, other than leading zeros
+        try:
+            return list(map(int, body.split(",")))
+        except ValueError:
+            pass
+    if _LITERAL_SEQUENCE.fullmatch(body) is None:
+        return None
+
+    if "'" in body or '"' in body:
+        tokens = _LITERAL_ELEMENT.findall(body)
+    else:
+        tokens = [token.strip(" \t") for token in body.split(",")]
+
+    elements = []
+    for token in tokens:
+        first_character = token[0]
+        if first_character in "'\"":
+            elements.append(token[1:-1])
+        elif first_character in "TFN":
+            elements.append(_KEYWORDS[token])
+        elif "." in token or "e" in token or "E" in token:
+            elements.append(float(token))
+        else:
+            elements.append(int(token))
+    return elements
+
+
+def _split_lines(string: str) -> list | None:
+    """Split a string of several plain lines, which ``ast.literal_eval()`` always rejects, into stripped lines."""
+    if _OPAQUE_CHARACTERS.search(string) is not None:
+        return None
+    if sum(1 for line in _LINE_BREAK.split(string) if line.strip(" \t\f") != "") < 2:
+        return None
+    if "\n" not in string:
+        # lines separated only by carriage returns are split on commas instead
+        return None
+    return [entry.strip() for entry in string.splitlines()]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Sequence
+
+from typepigeon.backends import optional_backend
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# number of recently-parsed strings to remember in ``parse_datetime()``
+DATETIME_CACHE_SIZE = 4096
+
+
+def _datetime_from_groups(match: re.Match) -> datetime:
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+    )
+
+
+def _datetime_from_isoformat(match: re.Match) -> datetime:
+    try:
+        return datetime.fromisoformat(match.string)
+    except ValueError:
+        # `datetime.fromisoformat()` is stricter on Python < 3.11
+        return _datetime_from_groups(match)
+
+
+# fixed formats that are parsed without `dateutil`, as (pattern, constructor) pairs;
+# these only match strings for which `dateutil.parser.parse()` gives the same result
+DATETIME_FORMATS: list[tuple[re.Pattern, Callable[[re.Match], datetime]]] = [
+    # 2021-03-26, 2021-03-26 00:56, 2021-03-26T00:56:00.123
+    (
+        re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?"),
+        _datetime_from_isoformat,
+    ),
+    # 20210326, 20210326T0056, 20210326T005600
+    (
+        re.compile(r"(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})?)?()"),
+        _datetime_from_groups,
+    ),
+]
+
+# index of the format that most recently matched, tried first for the next string
+_last_format_index = 0
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(string: str) -> datetime:
+    """Parse a datetime from the given string.
+
+    Common fixed formats (ISO 8601 and ``YYYYMMDD[THHMM[SS]]``) are parsed directly, starting with the format that
+    matched the previous string; anything else is parsed with ``dateutil.parser.parse()``.
+    Results are cached for recently-parsed strings; note that ``dateutil`` fills in missing components
+    (such as the date of ``'12:00'``) from the current date at the time the string is first parsed.
+
+    :param string: datetime string
+    :return: parsed datetime
+
+    >>> parse_datetime('20210326')
+    datetime.datetime(2021, 3, 26, 0, 0)
+    >>> parse_datetime('2020-11-07 09:38:16')
+    datetime.datetime(2020, 11, 7, 9, 38, 16)
+    >>> parse_datetime('March 26, 2021')
+    datetime.datetime(2021, 3, 26, 0, 0)
+    """
+    global _last_format_index  # noqa: PLW0603
+
+    for offset in range(len(DATETIME_FORMATS)):
+        format_index = (_last_format_index + offset) % len(DATETIME_FORMATS)
+        pattern, constructor = DATETIME_FORMATS[format_index]
+        match = pattern.fullmatch(string)
+        if match is not None:
+            try:
+                value = constructor(match)
+            except ValueError:
+                # out-of-range components; let `dateutil` decide
+                break
+            _last_format_index = format_index
+            return value
+
+    dateutil = optional_backend("dateutil")
+    if dateutil is None:
+        msg = f'unable to parse datetime from "{string}" (install `python-dateutil` to parse arbitrary formats)'
+        raise ValueError(msg)
+    return dateutil.parse(string)
+
+
+def parse_timedelta(string: str) -> timedelta:
+    """Parse a timedelta from a string of the form ``[[DD:]HH:]MM:SS``, or from a number of seconds.
+
+    :param string: timedelta string
+    :return: parsed timedelta
+
+    >>> parse_timedelta('01:13:20:15')
+    datetime.timedelta(days=1, seconds=48015)
+    >>> parse_timedelta('15')
+    datetime.timedelta(seconds=15)
+    """
+    if isinstance(string, str) and ":" in string:
+        parts = [float(part) for part in string.split(":")]
+        if len(parts) > 4:
+            msg = f'unable to parse timedelta from input "{string}"'
+            raise ValueError(msg)
+        # positional arguments are `(days, seconds, microseconds, milliseconds, minutes, hours)`
+        return timedelta(
+            parts[-4] if len(parts) > 3 else 0,
+            parts[-1],
+            0,
+            0,
+            parts[-2],
+            parts[-3] if len(parts) > 2 else 0,
+        )
+    return timedelta(seconds=float(string))
+
+
+def format_timedelta(value: timedelta) -> str:
+    """Format a timedelta as a string of the form ``HH:MM:SS.S``.
+
+    :param value: timedelta
+    :return: timedelta string
+
+    >>> format_timedelta(timedelta(hours=13, minutes=20, seconds=15))
+    '13:20:15.0'
+    """
+    hours, remainder = divmod(value, timedelta(hours=1))
+    minutes, remainder = divmod(remainder, timedelta(minutes=1))
+    seconds = remainder / timedelta(seconds=1)
+    return f"{hours:02}:{minutes:02}:{seconds:04.3}"
+
+
+def parse_timedeltas(strings: Sequence[str], as_array: bool = False) -> list[timedelta] | np.ndarray:
+    """Parse a sequence of timedelta strings (see ``parse_timedelta()``) in a single pass.
+
+    If NumPy is installed and all strings have the same number of components, the components of all strings are
+    parsed and summed in a few array operations; otherwise each string is parsed with ``parse_timedelta()``.
+
+    :param strings: sequence of timedelta strings
+    :param as_array: return a NumPy array of ``timedelta64[us]`` instead of a list of timedeltas
+    :return: parsed timedeltas
+
+    >>> parse_timedeltas(['20:15', '13:20:15'])
+    [datetime.timedelta(seconds=1215), datetime.timedelta(seconds=48015)]
+    """
+    microseconds = _vectorized_timedelta_microseconds(strings)
+    if microseconds is not None:
+        array = microseconds.astype("timedelta64[us]")
+        return array if as_array else array.tolist()
+
+    values = [parse_timedelta(string) for string in strings]
+    if as_array:
+        return optional_backend("numpy").asarray(values, dtype="timedelta64[us]")
+    return values
+
+
+def format_timedeltas(values: Sequence[timedelta] | np.ndarray) -> list[str]:
+    """Format a sequence of timedeltas (or a NumPy array of ``timedelta64``) as strings of the form ``HH:MM:SS.S``, in a single pass.
+
+    :param values: sequence of timedeltas
+    :return: timedelta strings
+
+    >>> format_timedeltas([timedelta(minutes=20, seconds=15), timedelta(days=1, hours=1)])
+    ['00:20:15.0', '25:00:00.0']
+    """
+    numpy = optional_backend("numpy")
+    if numpy is None or (
+        # timedeltas beyond about 292,000 years overflow 64-bit microseconds
+        not isinstance(values, numpy.ndarray)
+        and len(values) > 0
+        and not (-_MAXIMUM_VECTORIZED_TIMEDELTA < min(values) and max(values) < _MAXIMUM_VECTORIZED_TIMEDELTA)
+    ):
+        return [format_timedelta(value) for value in values]
+
+    microseconds = numpy.asarray(values, dtype="timedelta64[us]").astype("int64")
+    hours, remainder = divmod(microseconds, 3600 * 10**6)
+    minutes, remainder = divmod(remainder, 60 * 10**6)
+    seconds = remainder / 10**6
+    return [
+        f"{hours:02}:{minutes:02}:{seconds:04.3}"
+        for hours, minutes, seconds in zip(hours.tolist(), minutes.tolist(), seconds.tolist())
+    ]
+
+
+def _vectorized_timedelta_microseconds(strings: Sequence[str]) -> np.ndarray | None:
+    """Parse the given timedelta strings to integer microseconds with NumPy, if that gives the same results as ``parse_timedelta()``."""
+    numpy = optional_backend("numpy")
+    if numpy is None or len(strings) == 0 or not all(type(string) is str for string in strings):
+        return None
+
+    separator_counts = {string.count(":") for string in strings}
+    num_parts = separator_counts.pop() + 1
+    if len(separator_counts) > 0 or not 2 <= num_parts <= 4:
+        return None
+
+    try:
+        # each component is parsed with `float()`, exactly as in `parse_timedelta()`
+        parts = numpy.asarray(":".join(strings).split(":"), dtype="float64").reshape((-1, num_parts))
+    except ValueError:
+        return None
+
+    # `timedelta` carries fractional days, hours, and minutes into smaller units; only seconds may be fractional here
+    whole_parts = parts[:, :-1]
+    fractional_seconds, whole_seconds = numpy.modf(parts[:, -1])
+    seconds = whole_seconds + whole_parts @ numpy.asarray([86400, 3600, 60][-(num_parts - 1) :], dtype="float64")
+    if not (
+        numpy.isfinite(parts).all()
+        and (numpy.modf(whole_parts)[0] == 0).all()
+        and (abs(seconds) < _MAXIMUM_VECTORIZED_SECONDS).all()
+    ):
+        return None
+    return seconds.astype("int64") * 10**6 + (fractional_seconds * 10**6).round().astype("int64")
+
+
+# largest number of seconds whose microseconds fit in a 64-bit integer
+_MAXIMUM_VECTORIZED_SECONDS = 2**63 // 10**6
+_MAXIMUM_VECTORIZED_TIMEDELTA = timedelta(microseconds=2**63 - 1)
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
-from datetime import datetime  # noqa: F401
+import binascii
+import contextlib
+import math
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from enum import Enum
+from functools import partial
+from itertools import islice
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any, Collection, Mapping
+from typing import IO, Any, Callable, Collection, Iterator, Mapping
+from uuid import UUID
 
+from typepigeon.backends import backend_loaded, optional_backend
+from typepigeon.enums import enum_index
+from typepigeon.spatial import cached_crs_form
 from typepigeon.to_type import to_type
 
+# number of chunks to collect before writing to a file in ``dump_json()``
+DUMP_BUFFER_CHUNKS = 4096
 
-def to_json(input_value: Any) -> str | float | int | dict | list | bool:
+# encodings of binary data (``bytes``, ``bytearray``, and ``memoryview``) in ``to_json()``: a base64 or hexadecimal string,
+# or a list of the elements of the buffer (integers for bytes)
+BYTES_ENCODINGS = ("base64", "hex", "list")
+
+
+def to_json(input_value: Any, bytes_encoding: str = "base64", copy: bool = True) -> str | float | int | dict | list | bool:
     """Convert the given value to a JSON-compatible format.
 
+    A collection that appears several times in the input is only converted once, and its conversion appears at each of
+    those places in the output; a collection that contains itself raises a ``ValueError``.
+
+    Dictionaries and lists are always rebuilt by default. With ``copy=False``, a dictionary or list whose entries are
+    all already JSON values is returned as it is (and likewise reused wherever it is nested), so that converting
+    values that are already JSON-compatible allocates nothing.
+
     :param input_value: value to convert
+    :param bytes_encoding: encoding of binary data; one of ``'base64'``, ``'hex'``, or ``'list'``
+    :param copy: whether to always build new collections, rather than reusing those of the input that are already JSON values
     :return: JSON value
 
     >>> to_json(5)
@@ -26,27 +53,457 @@ def to_json(input_value: Any) -> str | float | int | dict | list | bool:
     [5, '6', {3: '2021-03-27 00:00:00'}]
     >>> to_json({'test': [5, '6', {3: datetime(2021, 3, 27)}]})
     {'test': [5, '6', {3: '2021-03-27 00:00:00'}]}
+
+    >>> to_json(b'binary')
+    'YmluYXJ5'
+    >>> to_json(b'binary', bytes_encoding='hex')
+    '62696e617279'
+
+    >>> values = {'test': [5, '6', None]}
+    >>> to_json(values, copy=False) is values
+    True
+    """
+    _check_bytes_encoding(bytes_encoding)
+    input_value = _json_value(input_value, bytes_encoding)
+    collection_type = _json_collection_type(input_value)
+    if collection_type is None:
+        return input_value
+    if not copy:
+        return _shared_json(input_value, collection_type, bytes_encoding)
+
+    # nested collections are walked with an explicit stack rather than by recursion, so that their depth is unlimited;
+    # each frame holds the remaining entries of an input collection, the JSON collection they are added to, and its ID
+    output_value = collection_type()
+    active_ids = set()
+    # conversions of the collections of the input that have been converted (or are being converted), by their ID, along with
+    # the input collections (which keeps collections made while iterating, such as the rows of arrays, from reusing the IDs)
+    memo = {id(input_value): (input_value, output_value)}
+    stack = [(_json_entries(input_value, collection_type), output_value, _enter_json_collection(input_value, active_ids))]
+    while len(stack) > 0:
+        entries, output_collection, identifier = stack[-1]
+        nested_value = None
+        if type(output_collection) is dict:
+            for key, entry in entries:
+                if type(key) not in _JSON_NATIVE_TYPES:
+                    key = to_json(key, bytes_encoding)
+                if type(entry) not in _JSON_NATIVE_TYPES:
+                    json_entry = _json_value(entry, bytes_encoding)
+                    collection_type = _json_collection_type(json_entry)
+                    if collection_type is None:
+                        entry = json_entry
+                    else:
+                        entry, nested_value = _nested_json(entry, json_entry, collection_type, memo, active_ids)
+                output_collection[key] = entry
+                if nested_value is not None:
+                    break
+        else:
+            for entry in entries:
+                if type(entry) not in _JSON_NATIVE_TYPES:
+                    json_entry = _json_value(entry, bytes_encoding)
+                    collection_type = _json_collection_type(json_entry)
+                    if collection_type is None:
+                        entry = json_entry
+                    else:
+                        entry, nested_value = _nested_json(entry, json_entry, collection_type, memo, active_ids)
+                output_collection.append(entry)
+                if nested_value is not None:
+                    break
+
+        if nested_value is None:
+            active_ids.discard(identifier)
+            stack.pop()
+        else:
+            stack.append(
+                (_json_entries(nested_value, collection_type), entry, _enter_json_collection(nested_value, active_ids))
+            )
+    return output_value
+
+
+def _nested_json(
+    entry: Any, json_entry: Collection, collection_type: type, memo: dict, active_ids: set[int]
+) -> tuple[Any, Any]:
+    """Find the conversion of a nested collection that has already been converted, or start a new (empty) conversion.
+
+    :return: the (possibly still empty) JSON collection, and the collection whose entries have yet to be converted (if any)
+    """
+    if json_entry is not entry:
+        # collections created by encoders are never shared, and may reuse the IDs of earlier ones once released
+        return collection_type(), json_entry
+    identifier = id(entry)
+    memoized = memo.get(identifier)
+    if memoized is None or identifier in active_ids:
+        output_value = collection_type()
+        memo[identifier] = (entry, output_value)
+        return output_value, entry
+    return memoized[1], None
+
+
+def _shared_json(input_value: Collection, collection_type: type, bytes_encoding: str) -> dict | list:
+    """Convert a collection like ``to_json()``, but reuse the input dictionaries and lists whose entries are all already JSON values."""
+    active_ids = set()
+    # conversions of collections that have been converted, by their ID, along with the input collections
+    memo = {}
+    stack = [_SharedJsonFrame(input_value, collection_type, _enter_json_collection(input_value, active_ids))]
+    converted_value = None
+    while True:
+        frame = stack[-1]
+        if converted_value is not None:
+            # the nested collection that interrupted this frame has been converted
+            frame.add(frame.key, frame.converted_key, frame.entry, converted_value)
+            converted_value = None
+
+        nested_value = None
+        is_mapping = frame.collection_type is dict
+        for item in frame.entries:
+            if is_mapping:
+                key, entry = item
+                converted_key = key if type(key) in _JSON_NATIVE_TYPES else to_json(key, bytes_encoding)
+            else:
+                key = converted_key = None
+                entry = item
+            converted_entry = entry
+            if type(entry) not in _JSON_NATIVE_TYPES:
+                converted_entry = _json_value(entry, bytes_encoding)
+                nested_type = _json_collection_type(converted_entry)
+                if nested_type is not None and not _is_json_leaf(converted_entry):
+                    memoized = memo.get(id(converted_entry))
+                    if memoized is not None:
+                        converted_entry = memoized[1]
+                    else:
+                        frame.key, frame.converted_key, frame.entry = key, converted_key, entry
+                        nested_value = converted_entry
+                        break
+            if frame.output is None and converted_entry is entry and converted_key is key:
+                frame.length += 1
+            else:
+                frame.add(key, converted_key, entry, converted_entry)
+
+        if nested_value is not None:
+            stack.append(_SharedJsonFrame(nested_value, nested_type, _enter_json_collection(nested_value, active_ids)))
+            continue
+
+        active_ids.discard(frame.identifier)
+        stack.pop()
+        converted_value = frame.source if frame.output is None else frame.output
+        memo[frame.identifier] = (frame.source, converted_value)
+        if len(stack) == 0:
+            return converted_value
+
+
+def _is_json_leaf(input_value: Any) -> bool:
+    """Whether the given value is a dictionary or list of JSON scalars only, which can be reused without walking it."""
+    value_type = type(input_value)
+    if value_type is list:
+        return set(map(type, input_value)) <= _JSON_SCALAR_TYPES
+    if value_type is dict:
+        return set(map(type, input_value)) <= _JSON_NATIVE_TYPES and set(map(type, input_value.values())) <= _JSON_SCALAR_TYPES
+    return False
+
+
+class _SharedJsonFrame:
+    """Progress of converting a collection in ``_shared_json()``.
+
+    While every entry converts to itself, no output is built (``output`` is ``None``) and only the number of unchanged
+    entries is counted; the output is built from the input at the first entry that changes.
+    """
+
+    __slots__ = ("collection_type", "converted_key", "entries", "entry", "identifier", "key", "length", "output", "source")
+
+    def __init__(self, source: Collection, collection_type: type, identifier: int):
+        self.source = source
+        self.collection_type = collection_type
+        self.identifier = identifier
+        self.entries = _json_entries(source, collection_type)
+        # collections of other types (such as tuples or sets) are always converted to a new dictionary or list
+        self.output = None if type(source) is collection_type else collection_type()
+        self.length = 0
+        self.key = self.converted_key = self.entry = None
+
+    def add(self, key: Any, converted_key: Any, entry: Any, converted_entry: Any):
+        if self.output is None:
+            if converted_entry is entry and converted_key is key:
+                self.length += 1
+                return
+            if self.collection_type is dict:
+                self.output = dict(islice(self.source.items(), self.length))
+            else:
+                self.output = self.source[: self.length]
+        if self.collection_type is dict:
+            self.output[converted_key] = converted_entry
+        else:
+            self.output.append(converted_entry)
+
+
+def iter_json(input_value: Any, bytes_encoding: str = "base64") -> Iterator[str]:
+    """Encode the given value as a JSON string, chunk by chunk, without building an intermediate copy of the value.
+
+    Values are converted with the same rules as ``to_json()``; concatenating the chunks gives the same string as
+    ``json.dumps(to_json(input_value))``.
+
+    :param input_value: value to encode
+    :param bytes_encoding: encoding of binary data; one of ``'base64'``, ``'hex'``, or ``'list'``
+    :return: iterator over chunks of JSON text
+
+    >>> ''.join(iter_json({'test': [5, '6', {3: datetime(2021, 3, 27)}]}))
+    '{"test": [5, "6", {"3": "2021-03-27 00:00:00"}]}'
+    """
+    _check_bytes_encoding(bytes_encoding)
+    input_value = _json_value(input_value, bytes_encoding)
+    collection_type = _json_collection_type(input_value)
+    if collection_type is None:
+        yield _encode_json_scalar(input_value)
+        return
+
+    # walked with an explicit stack, as in `to_json()`; each frame holds the remaining entries of a collection,
+    # whether it is a mapping, and its ID
+    active_ids = set()
+    is_mapping = collection_type is dict
+    stack = [(_json_entries(input_value, collection_type), is_mapping, _enter_json_collection(input_value, active_ids))]
+    yield "{" if is_mapping else "["
+    # whether no entry of the innermost collection has been written yet
+    first = True
+    while len(stack) > 0:
+        entries, is_mapping, identifier = stack[-1]
+        nested_value = None
+        for entry in entries:
+            if is_mapping:
+                key, entry = entry
+                yield _encode_json_key(key if type(key) in _JSON_NATIVE_TYPES else to_json(key, bytes_encoding), first=first)
+            elif not first:
+                yield ", "
+            first = False
+            if type(entry) not in _JSON_NATIVE_TYPES:
+                entry = _json_value(entry, bytes_encoding)
+                collection_type = _json_collection_type(entry)
+                if collection_type is not None:
+                    nested_value = entry
+                    break
+            yield _encode_json_scalar(entry)
+
+        if nested_value is None:
+            yield "}" if is_mapping else "]"
+            active_ids.discard(identifier)
+            stack.pop()
+            # the enclosing collection (if any) has at least this entry
+            first = False
+        else:
+            is_mapping = collection_type is dict
+            stack.append(
+                (_json_entries(nested_value, collection_type), is_mapping, _enter_json_collection(nested_value, active_ids))
+            )
+            yield "{" if is_mapping else "["
+            first = True
+
+
+def dump_json(input_value: Any, fp: IO[str], bytes_encoding: str = "base64"):
+    """Write the given value as JSON to a text file (or any object with a ``write()`` method, such as ``socket.makefile('w')``).
+
+    The value is encoded incrementally with ``iter_json()`` and written in batches, so the full JSON string is never held in memory.
+
+    :param input_value: value to encode
+    :param fp: writable text stream
+    :param bytes_encoding: encoding of binary data; one of ``'base64'``, ``'hex'``, or ``'list'``
     """
+    buffer = []
+    for chunk in iter_json(input_value, bytes_encoding):
+        buffer.append(chunk)
+        if len(buffer) >= DUMP_BUFFER_CHUNKS:
+            fp.write("".join(buffer))
+            buffer.clear()
+    if len(buffer) > 0:
+        fp.write("".join(buffer))
+
+
+def _json_value(input_value: Any, bytes_encoding: str = "base64") -> Any:
+    """Convert a single value to a JSON scalar, leaving collections (other than strings) for the caller to traverse."""
+    value_type = type(input_value)
+    enum_names = _ENUM_NAMES.get(value_type)
+    if enum_names is not None:
+        name = enum_names.get(id(input_value))
+        if name is not None:
+            return name
     if isinstance(input_value, Path):
         input_value = input_value.as_posix()
     elif isinstance(input_value, Enum):
+        _ENUM_NAMES[value_type] = enum_index(value_type).names
+        # flags combining several members are not in the index
         input_value = input_value.name
-    if type(input_value) not in (float, int, bool, str):
-        if isinstance(input_value, Collection) and not isinstance(input_value, str):
-            input_value = (
-                {to_json(key): to_json(entry) for key, entry in input_value.items()}
-                if isinstance(input_value, Mapping)
-                else [to_json(entry) for entry in input_value]
-            )
-        else:
-            try:
-                input_value = to_type(input_value, float)
-            except:
-                try:
-                    input_value = to_type(input_value, int)
-                except:
-                    try:
-                        input_value = to_type(input_value, bool)
-                    except:
-                        input_value = to_type(input_value, str)
+    value_type = type(input_value)
+    if isinstance(input_value, (bytes, bytearray, memoryview)):
+        input_value = _encode_bytes(input_value, bytes_encoding)
+    elif value_type not in _JSON_NATIVE_TYPES and value_type not in _JSON_COLLECTION_TYPES:
+        encoder = _JSON_ENCODERS.get(value_type)
+        if encoder is None:
+            if isinstance(input_value, Collection) and not isinstance(input_value, str):
+                return input_value
+            encoder = _find_json_encoder(value_type)
+        try:
+            input_value = encoder(input_value)
+        except:
+            input_value = _json_fallback(input_value)
     return input_value
+
+
+def _check_bytes_encoding(bytes_encoding: str):
+    """Raise an error if the given encoding of binary data is not one of ``BYTES_ENCODINGS``."""
+    if bytes_encoding not in BYTES_ENCODINGS:
+        msg = f'unrecognized bytes encoding "{bytes_encoding}"; must be one of {list(BYTES_ENCODINGS)}'
+        raise ValueError(msg)
+
+
+def _encode_bytes(input_value: bytes | bytearray | memoryview, bytes_encoding: str) -> str | list:
+    """Encode binary data directly from its buffer, without copying it to ``bytes`` first (unless it is not contiguous)."""
+    if bytes_encoding == "base64":
+        if isinstance(input_value, memoryview) and not input_value.contiguous:
+            input_value = input_value.tobytes()
+        encoded_value = binascii.b2a_base64(input_value, newline=False).decode("ascii")
+    elif bytes_encoding == "hex":
+        encoded_value = input_value.hex()
+    else:
+        # the elements of the buffer in its own format (integers for bytes, floats for a memoryview of doubles)
+        encoded_value = memoryview(input_value).tolist()
+    return encoded_value
+
+
+def _json_collection_type(input_value: Any) -> type | None:
+    """Find the JSON collection type (``dict`` or ``list``) that the given value (already passed through ``_json_value()``) is converted to, or ``None`` if it is not a collection."""
+    value_type = type(input_value)
+    collection_type = _JSON_COLLECTION_TYPES.get(value_type)
+    if (
+        collection_type is None
+        and value_type not in _JSON_SCALAR_TYPES
+        and isinstance(input_value, Collection)
+        and not isinstance(input_value, str)
+    ):
+        collection_type = dict if isinstance(input_value, Mapping) else list
+    return collection_type
+
+
+def _json_entries(input_value: Collection, collection_type: type) -> Iterator:
+    """Iterate over the ``(key, value)`` pairs of a mapping, or over the entries of any other collection."""
+    return iter(input_value.items()) if collection_type is dict else iter(input_value)
+
+
+def _enter_json_collection(input_value: Collection, active_ids: set[int]) -> int:
+    """Mark the given collection as being traversed, raising an error if it is already being traversed (if it contains itself)."""
+    identifier = id(input_value)
+    if identifier in active_ids:
+        msg = f"circular reference detected in {input_value.__class__.__name__}"
+        raise ValueError(msg)
+    active_ids.add(identifier)
+    return identifier
+
+
+def _json_fallback(input_value: Any) -> Any:
+    """Convert the given value to the first of ``float``, ``int``, ``bool``, or ``str`` that succeeds.
+
+    If ``float`` succeeds, it is used directly for later values of the same type (falling back to this cascade for values
+    that it fails on); any other result may depend on the value (such as a ``str`` subclass holding a number or a word),
+    so later values of the type still go through the whole cascade.
+    """
+    for output_type in _JSON_FALLBACK_TYPES:
+        with contextlib.suppress(Exception):
+            converted_value = to_type(input_value, output_type)
+            break
+    else:
+        output_type = str
+        converted_value = to_type(input_value, output_type)
+    if output_type is float:
+        _JSON_ENCODERS[type(input_value)] = _JSON_FLOAT_ENCODER
+    return converted_value
+
+
+def _find_json_encoder(value_type: type) -> Callable[[Any], Any]:
+    """Find a direct encoder for the given type (or one of its bases); otherwise, encode with the ``float`` -> ``int`` -> ``bool`` -> ``str`` fallback."""
+    for backend in list(_BACKEND_JSON_ENCODERS):
+        if backend_loaded(backend):
+            register_backend_encoders = _BACKEND_JSON_ENCODERS.pop(backend, None)
+            if register_backend_encoders is not None:
+                register_backend_encoders()
+
+    for base_type in value_type.__mro__:
+        encoder = _DIRECT_JSON_ENCODERS.get(base_type)
+        if encoder is not None:
+            break
+    else:
+        encoder = _json_fallback
+    _JSON_ENCODERS[value_type] = encoder
+    return encoder
+
+
+def _encode_crs(input_value: Any) -> int | str:
+    epsg = cached_crs_form(input_value, "to_epsg")
+    return epsg if epsg is not None else cached_crs_form(input_value, "to_wkt")
+
+
+def _register_pyproj_encoders():
+    _DIRECT_JSON_ENCODERS[optional_backend("pyproj").CRS] = _encode_crs
+
+
+def _register_shapely_encoders():
+    _DIRECT_JSON_ENCODERS[optional_backend("shapely").BaseGeometry] = str
+
+
+# types that are already JSON values, and are left as they are
+_JSON_NATIVE_TYPES = frozenset((float, int, bool, str))
+
+# types of JSON scalars (encoded values that are never collections), which skip the slower check for collections
+_JSON_SCALAR_TYPES = _JSON_NATIVE_TYPES | {type(None)}
+
+# JSON collection types that builtin collections are converted to
+_JSON_COLLECTION_TYPES = {dict: dict, list: list, tuple: list, set: list, frozenset: list}
+
+_JSON_FALLBACK_TYPES = (float, int, bool, str)
+_JSON_FLOAT_ENCODER = partial(to_type, output_type=float)
+
+# encoders of types that would otherwise raise several exceptions in the fallback
+_DIRECT_JSON_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    type(None): lambda input_value: None,
+    datetime: str,
+    date: str,
+    timedelta: lambda input_value: input_value / timedelta(seconds=1),
+    Decimal: float,
+    UUID: str,
+}
+
+# encoders of optional backends are only registered once the backend is imported
+_BACKEND_JSON_ENCODERS: dict[str, Callable[[], None]] = {
+    "pyproj": _register_pyproj_encoders,
+    "shapely": _register_shapely_encoders,
+}
+
+# names of the members of each enumeration encountered so far, by the ID of the member
+_ENUM_NAMES: dict[type, dict[int, str]] = {}
+
+# encoder used for each concrete type encountered so far
+_JSON_ENCODERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _encode_json_scalar(input_value: Any) -> str:
+    """Encode a scalar the same way as ``json.dumps()``."""
+    if isinstance(input_value, str):
+        return encode_basestring_ascii(input_value)
+    if input_value is None or isinstance(input_value, bool):
+        return "null" if input_value is None else "true" if input_value else "false"
+    if isinstance(input_value, int):
+        return int.__repr__(input_value)
+    if isinstance(input_value, float):
+        if math.isnan(input_value):
+            return "NaN"
+        if math.isinf(input_value):
+            return "Infinity" if input_value > 0 else "-Infinity"
+        return float.__repr__(input_value)
+    msg = f"Object of type {input_value.__class__.__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _encode_json_key(key: Any, first: bool) -> str:
+    """Encode a mapping key (and its surrounding separators) the same way as ``json.dumps()``."""
+    if not isinstance(key, str):
+        if key is None or isinstance(key, (bool, int, float)):
+            key = _encode_json_scalar(key)
+        else:
+            msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+            raise TypeError(msg)
+    key = encode_basestring_ascii(key)
+    return f"{key}: " if first else f", {key}: "
@@ -1,36 +1,553 @@
 from __future__ import annotations
 
 import ast
-import contextlib
 import json
+import operator
 import sys
-from datetime import date, datetime, time, timedelta
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta  # noqa: F401
 from enum import Enum, EnumMeta
-from functools import lru_cache
-from typing import Any, Collection, Iterable, Mapping
+from itertools import islice
+from typing import Any, Callable, Collection, Hashable, Iterable, Iterator, Mapping
 
-from typepigeon.types import subscripted_type
+from typepigeon import profiling
+from typepigeon.arrays import vectorizable, vectorized_conversion
+from typepigeon.backends import backend_loaded, optional_backend
+from typepigeon.converters import convert_scalar
+from typepigeon.enums import enum_index
+from typepigeon.records import is_record_type, record_fields
+from typepigeon.spatial import cached_crs_form
+from typepigeon.strings import split_collection_string
+from typepigeon.types import canonical_type, type_from_canonical
 
+_COMPILED_CONVERTERS: dict[Hashable, ConversionPlan] = {}
+_COMPILED_CONVERTERS_MAXSIZE = 1024
 
-@lru_cache(maxsize=None)
-def installed_packages() -> list[str]:
+# types of inputs that are looked up directly in the index of an enumeration, without first converting enumeration members
+# (of other enumerations) to their names
+_ENUM_LOOKUP_TYPES = frozenset((str, int, float))
+
+# handling of entries that cannot be converted in ``to_type()``: raise the first error, replace failures with ``None``,
+# or replace failures with ``None`` and then raise all errors together in a ``ConversionErrors``
+ERROR_MODES = ("raise", "coerce", "collect")
+
+# sequences whose entries are converted one by one with `copy=False`, so that entries that already conform can be reused
+_SHARED_SEQUENCE_TYPES = frozenset((list, tuple, set, frozenset))
+
+
+class ConversionErrors(ValueError):
+    """Entries of a value that could not be converted by ``to_type(..., errors='collect')``.
+
+    ``errors`` lists the failures as ``(path, exception)`` pairs, where the path is a tuple of the indices, keys, and field
+    names leading to the entry in the input value; ``value`` is the converted value, with ``None`` in place of each failure.
+    """
+
+    def __init__(self, value: Any, errors: list[tuple[tuple, Exception]]):
+        path, error = errors[0]
+        super().__init__(f"unable to convert {len(errors)} entries; first at {list(path)}: {error}")
+        self.value = value
+        self.errors = errors
+
+
+class ConversionPlan(ABC):
+    """Reusable conversion to a single output type, with the type tree resolved ahead of time by ``compile_converter()``.
+
+    Calling the plan with a value converts that value to the output type. This is an abstract base class; the plans returned
+    by ``compile_converter()`` are instances of its (private) subclasses, one for each kind of output type.
+    """
+
+    __slots__ = ("output_type",)
+
+    def __init__(self, output_type: Any):
+        self.output_type = output_type
+
+    @abstractmethod
+    def __call__(self, input_value: Any) -> Any:
+        """Convert a value to the output type of the plan."""
+
+    def _collect(self, input_value: Any, path: tuple, errors: list[tuple[tuple, Exception]]) -> Any:
+        """Convert a value like calling the plan, but record the failures of nested entries in ``errors`` as ``(path, exception)`` pairs (substituting ``None`` for them) rather than raising them."""
+        return self(input_value)
+
+    def _share(self, input_value: Any) -> Any:
+        """Convert a value like calling the plan, but return the input value itself (or reuse its nested collections) where it already conforms to the output type."""
+        return self(input_value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.output_type!r})"
+
+
+class _NonePlan(ConversionPlan):
+    __slots__ = ()
+
+    def __call__(self, input_value: Any) -> None:
+        return None
+
+
+class _AnyPlan(ConversionPlan):
+    __slots__ = ()
+
+    def __call__(self, input_value: Any) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        return input_value
+
+
+class _ScalarPlan(ConversionPlan):
+    __slots__ = ()
+
+    def __call__(self, input_value: Any) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None or type(input_value) is self.output_type:
+            return input_value
+        return convert_scalar(input_value, self.output_type)
+
+
+class _EnumPlan(ConversionPlan):
+    __slots__ = ("index",)
+
+    def __init__(self, output_type: EnumMeta):
+        super().__init__(output_type)
+        self.index = enum_index(output_type)
+
+    def __call__(self, input_value: Any) -> Any:
+        if type(input_value) in _ENUM_LOOKUP_TYPES and profiling.ACTIVE_PROFILE is None:
+            # names and values given as plain strings and numbers are found with a single lookup
+            member = self.index.members.get(input_value)
+            if member is not None:
+                return member
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None:
+            return None
+        if profiling.ACTIVE_PROFILE is not None:
+            return profiling.measure(profiling.ACTIVE_PROFILE, self._convert, input_value, self.output_type, "index")
+        return self._convert(input_value)
+
+    def _convert(self, input_value: Any) -> Any:
+        try:
+            member = self.index.members.get(input_value)
+        except TypeError:
+            member = None
+        if member is None and isinstance(input_value, str):
+            profiling.note_branch("casefold")
+            member = self.index.casefolded.get(input_value.casefold())
+        if member is None:
+            # flags combining several members, and enumerations that define `_missing_()`, are left to the constructor
+            profiling.note_fallback()
+            try:
+                profiling.note_branch("constructor")
+                member = self.output_type(input_value)
+            except (KeyError, ValueError) as error:
+                msg = f'unrecognized entry "{input_value}"; must be one of {list(self.output_type)}'
+                raise ValueError(msg) from error
+        return member
+
+
+class _SequencePlan(ConversionPlan):
+    __slots__ = ("collection_type", "element_plans", "element_type", "vectorized_type")
+
+    def __init__(self, output_type: Collection, element_plans: list[ConversionPlan]):
+        super().__init__(output_type)
+        self.collection_type = type(output_type)
+        self.element_plans = tuple(element_plans)
+        self.element_type = _passthrough_type(element_plans[0]) if len(element_plans) == 1 else None
+        # homogeneous sequences of numbers and strings can be converted by NumPy in a single operation
+        self.vectorized_type = None
+        if len(element_plans) == 1 and type(element_plans[0]) is _ScalarPlan:
+            self.vectorized_type = element_plans[0].output_type
+
+    def __call__(self, input_value: Any) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None:
+            return self.collection_type()
+        if profiling.ACTIVE_PROFILE is not None:
+            return profiling.measure(profiling.ACTIVE_PROFILE, self._convert, input_value, self.output_type, "elementwise")
+        return self._convert(input_value)
+
+    def _convert(self, input_value: Any) -> Any:
+        input_value, converted_values = self._entries(input_value)
+        if converted_values is None:
+            element_plans = self.element_plans
+            if len(element_plans) == 1:
+                element_plan = element_plans[0]
+                element_type = self.element_type
+                converted_values = [entry if type(entry) is element_type else element_plan(entry) for entry in input_value]
+            else:
+                converted_values = [element_plan(entry) for element_plan, entry in zip(element_plans, input_value)]
+
+        if self.collection_type is list:
+            return converted_values
+        return self.collection_type(converted_values)
+
+    def _collect(self, input_value: Any, path: tuple, errors: list[tuple[tuple, Exception]]) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None:
+            return self.collection_type()
+
+        input_value, converted_values = self._entries(input_value)
+        if converted_values is None:
+            element_plans = self.element_plans
+            if len(element_plans) == 1:
+                element_type = self.element_type
+                collect = element_plans[0]._collect
+                converted_values = []
+                for index, entry in enumerate(input_value):
+                    if type(entry) is not element_type:
+                        try:
+                            entry = collect(entry, (*path, index), errors)
+                        except RecursionError:
+                            raise
+                        except Exception as error:  # noqa: BLE001
+                            errors.append(((*path, index), error))
+                            entry = None
+                    converted_values.append(entry)
+            else:
+                converted_values = [
+                    _collect_entry(element_plan, entry, (*path, index), errors)
+                    for index, (element_plan, entry) in enumerate(zip(element_plans, input_value))
+                ]
+
+        if self.collection_type is list:
+            return converted_values
+        return self.collection_type(converted_values)
+
+    def _share(self, input_value: Any) -> Any:
+        element_plans = self.element_plans
+        if type(input_value) not in _SHARED_SEQUENCE_TYPES or len(element_plans) not in (1, len(input_value)):
+            return self(input_value)
+
+        if len(element_plans) == 1:
+            element_type = self.element_type
+            if element_type is not None:
+                conforming = type(input_value) is self.collection_type and set(map(type, input_value)) <= {element_type}
+                return input_value if conforming else self(input_value)
+            converted_values = list(map(element_plans[0]._share, input_value))
+        else:
+            converted_values = [element_plan._share(entry) for element_plan, entry in zip(element_plans, input_value)]
+
+        if type(input_value) is self.collection_type and all(map(operator.is_, converted_values, input_value)):
+            return input_value
+        if self.collection_type is list:
+            return converted_values
+        return self.collection_type(converted_values)
+
+    def _entries(self, input_value: Any) -> tuple[Collection, list | None]:
+        """Interpret the input as a collection of entries, and convert them in a single operation if possible (otherwise giving ``None`` as the converted values)."""
+        if not isinstance(input_value, Iterable) or isinstance(input_value, str):
+            input_value = _split_collection_string(input_value)
+
+        if self.vectorized_type is not None and vectorizable(input_value):
+            converted_array = vectorized_conversion(input_value, self.vectorized_type)
+            if converted_array is not None:
+                profiling.note_branch("vectorized")
+                return input_value, converted_array.tolist()
+
+        if isinstance(input_value, memoryview):
+            # extract the elements of a typed (or multi-dimensional) buffer in one pass
+            input_value = input_value.tolist()
+
+        if len(self.element_plans) != 1 and len(self.element_plans) != len(input_value):
+            output_types = [element_plan.output_type for element_plan in self.element_plans]
+            msg = f"unable to convert list of values of length {len(input_value)} to list of types of length {len(output_types)}: {input_value} -/> {output_types}"
+            raise ValueError(msg)
+        return input_value, None
+
+
+class _MappingPlan(ConversionPlan):
+    __slots__ = ("collection_type", "key_plan", "key_type", "value_plan", "value_type")
+
+    def __init__(self, output_type: Mapping, key_plan: ConversionPlan | None, value_plan: ConversionPlan | None):
+        super().__init__(output_type)
+        self.collection_type = type(output_type)
+        self.key_plan = key_plan
+        self.value_plan = value_plan
+        self.key_type = _passthrough_type(key_plan)
+        self.value_type = _passthrough_type(value_plan)
+
+    def __call__(self, input_value: Any) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if profiling.ACTIVE_PROFILE is not None:
+            return profiling.measure(profiling.ACTIVE_PROFILE, self._convert, input_value, self.output_type, "mapping")
+        return self._convert(input_value)
+
+    def _convert(self, input_value: Any) -> Any:
+        return self._convert_parsed(self._parse(input_value))
+
+    def _parse(self, input_value: Any) -> Any:
+        """Parse a mapping given as a JSON string (with single or double quotes)."""
+        if isinstance(input_value, str):
+            profiling.note_branch("json")
+            input_value = json.loads(input_value.replace("'", '"'))
+        return input_value
+
+    def _convert_parsed(self, input_value: Any) -> Any:
+        if isinstance(input_value, Mapping):
+            if self.key_plan is None:
+                profiling.note_branch("copy")
+                return self.collection_type(input_value)
+            key_plan = self.key_plan
+            key_type = self.key_type
+            value_plan = self.value_plan
+            value_type = self.value_type
+            input_value = self.collection_type(
+                [
+                    (
+                        key if type(key) is key_type else key_plan(key),
+                        sub_value if type(sub_value) is value_type else value_plan(sub_value),
+                    )
+                    for key, sub_value in input_value.items()
+                ]
+            )
+        elif backend_loaded("pyproj") and isinstance(input_value, optional_backend("pyproj").CRS):
+            profiling.note_branch("crs")
+            input_value = cached_crs_form(input_value, "to_json_dict")
+        return input_value
+
+    def _share(self, input_value: Any) -> Any:
+        if type(input_value) is not self.collection_type:
+            return self(input_value)
+        if self.key_plan is None:
+            return input_value
+
+        key_plan = self.key_plan
+        key_type = self.key_type
+        value_plan = self.value_plan
+        value_type = self.value_type
+        # entries are only collected from the first one that differs from the input
+        converted_entries = None
+        for index, (key, sub_value) in enumerate(input_value.items()):
+            converted_key = key if type(key) is key_type else key_plan(key)
+            converted_value = sub_value if type(sub_value) is value_type else value_plan._share(sub_value)
+            if converted_entries is None:
+                if converted_key is key and converted_value is sub_value:
+                    continue
+                converted_entries = list(islice(input_value.items(), index))
+            converted_entries.append((converted_key, converted_value))
+        return input_value if converted_entries is None else self.collection_type(converted_entries)
+
+    def _collect(self, input_value: Any, path: tuple, errors: list[tuple[tuple, Exception]]) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        input_value = self._parse(input_value)
+        if self.key_plan is None or not isinstance(input_value, Mapping):
+            return self._convert_parsed(input_value)
+
+        converted_entries = []
+        for key, sub_value in input_value.items():
+            try:
+                converted_key = self.key_plan(key)
+            except Exception as error:  # noqa: BLE001
+                # entries whose keys cannot be converted are left out
+                errors.append(((*path, key), error))
+                continue
+            converted_entries.append((converted_key, _collect_entry(self.value_plan, sub_value, (*path, key), errors)))
+        return self.collection_type(converted_entries)
+
+
+class _RecordPlan(ConversionPlan):
+    __slots__ = ("field_plans",)
+
+    def __init__(self, output_type: type):
+        super().__init__(output_type)
+        # compiled on first use, so that classes with fields of their own type do not recurse indefinitely
+        self.field_plans: dict[str, ConversionPlan] | None = None
+
+    def __call__(self, input_value: Any) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None or type(input_value) is self.output_type:
+            return input_value
+        if profiling.ACTIVE_PROFILE is not None:
+            return profiling.measure(profiling.ACTIVE_PROFILE, self._convert, input_value, self.output_type, "fields")
+        return self._convert(input_value)
+
+    def _convert(self, input_value: Any) -> Any:
+        field_plans = self.field_plans
+        if field_plans is None:
+            field_plans = self.field_plans = self._compile_fields()
+
+        input_value = self._fields_input(input_value)
+        try:
+            if isinstance(input_value, Mapping):
+                # entries that are not fields are left out
+                fields = {name: field_plans[name](value) for name, value in input_value.items() if name in field_plans}
+            elif isinstance(input_value, (list, tuple)):
+                fields = {name: field_plan(value) for (name, field_plan), value in zip(field_plans.items(), input_value)}
+            else:
+                profiling.note_branch("constructor")
+                return convert_scalar(input_value, self.output_type)
+        except RecursionError as error:
+            raise _nesting_error(self.output_type, error) from None
+        return self.output_type(**fields)
+
+    def _collect(self, input_value: Any, path: tuple, errors: list[tuple[tuple, Exception]]) -> Any:
+        if isinstance(input_value, Enum):
+            input_value = input_value.name
+        if input_value is None or type(input_value) is self.output_type:
+            return input_value
+        if self.field_plans is None:
+            self.field_plans = self._compile_fields()
+
+        input_value = self._fields_input(input_value)
+        try:
+            if isinstance(input_value, Mapping):
+                fields = {
+                    name: _collect_entry(self.field_plans[name], value, (*path, name), errors)
+                    for name, value in input_value.items()
+                    if name in self.field_plans
+                }
+            elif isinstance(input_value, (list, tuple)):
+                fields = {
+                    name: _collect_entry(field_plan, value, (*path, index), errors)
+                    for index, ((name, field_plan), value) in enumerate(zip(self.field_plans.items(), input_value))
+                }
+            else:
+                return convert_scalar(input_value, self.output_type)
+        except RecursionError as error:
+            raise _nesting_error(self.output_type, error) from None
+        return self.output_type(**fields)
+
+    def _fields_input(self, input_value: Any) -> Any:
+        """Parse a JSON object or array given as a string, and check that a sequence of field values is not too long."""
+        if isinstance(input_value, str) and input_value.lstrip()[:1] in ("{", "["):
+            profiling.note_branch("json")
+            input_value = json.loads(input_value.replace("'", '"'))
+        if isinstance(input_value, (list, tuple)) and len(input_value) > len(self.field_plans):
+            msg = f"unable to convert list of values of length {len(input_value)} to {self.output_type.__name__} with {len(self.field_plans)} fields: {input_value}"
+            raise ValueError(msg)
+        return input_value
+
+    def _compile_fields(self) -> dict[str, ConversionPlan]:
+        field_plans = {}
+        for name, field_type in record_fields(self.output_type).items():
+            try:
+                canonical = canonical_type(field_type)
+            except (TypeError, NotImplementedError):
+                # annotations that are not type specifications, such as `Literal['a', 'b']`
+                canonical = Any
+            field_plans[name] = _compile_canonical(canonical)
+        return field_plans
+
+
+def _collect_entry(plan: ConversionPlan, input_value: Any, path: tuple, errors: list[tuple[tuple, Exception]]) -> Any:
+    """Convert an entry of a collection with the given plan, recording a failure (and substituting ``None``) rather than raising it."""
+    try:
+        return plan._collect(input_value, path, errors)
+    except RecursionError:
+        # too deeply nested input is not a failure of this entry, and is never replaced with `None`
+        raise
+    except Exception as error:  # noqa: BLE001
+        errors.append((path, error))
+        return None
+
+
+class _NestingError(RecursionError):
+    """Recursion limit reached while converting nested records, with the type of the innermost record in the message."""
+
+
+def _nesting_error(output_type: type, error: RecursionError) -> RecursionError:
+    """Describe a recursion error raised while converting the fields of a record, unless it has already been described."""
+    if isinstance(error, _NestingError):
+        return error
+    msg = f"unable to convert to {output_type.__name__}: records are nested deeper than the recursion limit ({sys.getrecursionlimit()}) allows"
+    return _NestingError(msg)
+
+
+def _passthrough_type(plan: ConversionPlan | None) -> type | None:
+    """Find the type of values that the given plan returns as they are, so that collection plans can skip calling it for them."""
+    return plan.output_type if type(plan) in (_ScalarPlan, _RecordPlan) else None
+
+
+def compile_converter(output_type: type | Collection[type]) -> Callable[[Any], Any]:
+    """Resolve the given output type once into a reusable converter.
+
+    The returned converter behaves exactly like ``to_type(value, output_type)``,
+    but nested type specifications, generic aliases, and type names are only analyzed once.
+
+    :param output_type: type to convert to
+    :return: converter accepting a single value
+
+    >>> converter = compile_converter({str: [float]})
+    >>> converter({'a': [1, '2.5'], 3: ()})
+    {'a': [1.0, 2.5], '3': []}
+    >>> converter({'b': '4, 5'})
+    {'b': [4.0, 5.0]}
+    """
+    return _compile_canonical(canonical_type(output_type))
+
+
+def _compile_canonical(canonical: Hashable) -> ConversionPlan:
+    """Compile the plan of a canonical type (see ``canonical_type()``), compiling the plans of its members recursively."""
+    if isinstance(canonical, str):
+        canonical = canonical_type(getattr(sys.modules["builtins"], canonical))
+
+    if canonical is None:
+        plan = _NonePlan(canonical)
+    elif canonical is Any:
+        plan = _AnyPlan(canonical)
+    elif isinstance(canonical, EnumMeta):
+        plan = _EnumPlan(canonical)
+    elif is_record_type(canonical):
+        # reuse the plan of the same class (and its compiled fields) wherever the class is nested
+        plan = _COMPILED_CONVERTERS.get(canonical)
+        if type(plan) is not _RecordPlan:
+            plan = _RecordPlan(canonical)
+    elif isinstance(canonical, tuple):
+        collection_type, members = canonical
+        output_type = type_from_canonical(canonical)
+        if issubclass(collection_type, Mapping):
+            if len(members) > 0:
+                key_type, value_type = members[0]
+                plan = _MappingPlan(output_type, _compile_canonical(key_type), _compile_canonical(value_type))
+            else:
+                plan = _MappingPlan(output_type, None, None)
+        else:
+            plan = _SequencePlan(output_type, [_compile_canonical(member_type) for member_type in members])
+    else:
+        plan = _ScalarPlan(canonical)
+    return plan
+
+
+def _cached_converter(output_type: Any) -> ConversionPlan:
+    """Retrieve the compiled converter of the given output type, compiling it on first use."""
     try:
-        from importlib import metadata as importlib_metadata
-    except ImportError:  # for Python<3.8
-        import importlib_metadata
-    installed_distributions = importlib_metadata.distributions()
-    return [
-        distribution.metadata["Name"].lower()
-        for distribution in installed_distributions
-        if distribution.metadata["Name"] is not None
-    ]
-
-
-def to_type(input_value: Any, output_type: type | Collection[type]) -> Any:
+        key = canonical_type(output_type)
+        return _COMPILED_CONVERTERS[key]
+    except KeyError:
+        converter = _compile_canonical(key)
+        if len(_COMPILED_CONVERTERS) >= _COMPILED_CONVERTERS_MAXSIZE:
+            _COMPILED_CONVERTERS.clear()
+        _COMPILED_CONVERTERS[key] = converter
+        return converter
+    except TypeError:
+        # type specification with unhashable members
+        return compile_converter(output_type)
+
+
+def to_type(input_value: Any, output_type: type | Collection[type], errors: str = "raise", copy: bool = True) -> Any:
     """Convert a value to the specified type.
 
+    By default, the first entry of a collection that cannot be converted raises its error. With ``errors='coerce'``,
+    entries that cannot be converted (at any depth) are replaced with ``None`` (and mapping entries whose keys cannot be
+    converted are left out); with ``errors='collect'``, the whole value is likewise converted, and then a
+    ``ConversionErrors`` is raised listing every entry that failed, along with the partially converted value.
+    Records with fields of their own type are converted recursively, so input nested deeper than the recursion limit
+    raises a ``RecursionError`` in every mode.
+
+    Collections are always rebuilt by default, so that the result never shares mutable state with the input.
+    With ``copy=False``, a list, tuple, or dictionary that already conforms to the output type (its entries are already
+    exactly of their output types) is returned as it is, and conforming nested collections are reused in the result,
+    which avoids copying large inputs that are mostly valid (only with ``errors='raise'``).
+
     :param input_value: Python value
     :param output_type: type to convert to
+    :param errors: handling of entries that cannot be converted; one of ``'raise'``, ``'coerce'``, or ``'collect'``
+    :param copy: whether to always build new collections, rather than reusing those of the input that already conform
     :return: converted value
 
     >>> to_type(0.55, str)
@@ -69,160 +586,72 @@ def to_type(input_value: Any, output_type: type | Collection[type]) -> Any:
     GEOGCRS["WGS 84",ENSEMBLE["World Geodetic System 1984 ensemble",MEMBER["World Geodetic System 1984 (Transit)"],MEMBER["World Geodetic System 1984 (G730)"],MEMBER["World Geodetic System 1984 (G873)"],MEMBER["World Geodetic System 1984 (G1150)"],MEMBER["World Geodetic System 1984 (G1674)"],MEMBER["World Geodetic System 1984 (G1762)"],ELLIPSOID["WGS 84",6378137,298.257223563,LENGTHUNIT["metre",1]],ENSEMBLEACCURACY[2.0]],PRIMEM["Greenwich",0,ANGLEUNIT["degree",0.0174532925199433]],CS[ellipsoidal,2],AXIS["geodetic latitude (Lat)",north,ORDER[1],ANGLEUNIT["degree",0.0174532925199433]],AXIS["geodetic longitude (Lon)",east,ORDER[2],ANGLEUNIT["degree",0.0174532925199433]],USAGE[SCOPE["Horizontal component of 3D system."],AREA["World."],BBOX[-90,-180,90,180]],ID["EPSG",4326]]
     >>> to_type(4326, CRS)
     CRS.from_epsg(4326)
+
+    >>> to_type(['2021-03-26', 'not a date'], [datetime], errors='coerce')
+    [datetime.datetime(2021, 3, 26, 0, 0), None]
+
+    >>> values = {'a': [1.5, 2.0]}
+    >>> to_type(values, {str: [float]}, copy=False) is values
+    True
     """
-    if isinstance(output_type, str):
-        output_type = getattr(sys.modules["builtins"], output_type)
+    converter = _cached_converter(output_type)
+    if errors == "raise":
+        return converter(input_value) if copy else converter._share(input_value)
+    if errors not in ERROR_MODES:
+        msg = f'unrecognized error handling "{errors}"; must be one of {list(ERROR_MODES)}'
+        raise ValueError(msg)
 
-    if isinstance(input_value, Enum):
-        input_value = input_value.name
+    failures = []
+    output_value = _collect_entry(converter, input_value, (), failures)
+    if errors == "collect" and len(failures) > 0:
+        raise ConversionErrors(output_value, failures)
+    return output_value
 
-    output_type = subscripted_type(output_type)
 
-    if output_type is None:
-        input_value = None
-    elif output_type is Any:
-        return input_value
+def to_type_many(input_values: Iterable, output_type: type | Collection[type]) -> Iterator:
+    """Convert each of the given values to the specified type, resolving the type only once.
 
-    if isinstance(output_type, Collection):
-        collection_type = type(output_type)
-        if collection_type is not EnumMeta:
-            if not issubclass(collection_type, Mapping):
-                if input_value is not None:
-                    output_type = list(output_type)
-                    if not isinstance(input_value, Iterable) or isinstance(input_value, str):
-                        try:
-                            evaluated_value = ast.literal_eval(input_value)
-                            if not isinstance(evaluated_value, Collection):
-                                raise TypeError
-                            input_value = evaluated_value
-                        except:
-                            if isinstance(input_value, str):
-                                if "\n" in input_value:
-                                    entries = input_value.splitlines()
-                                elif "," in input_value:
-                                    entries = input_value.split(",")
-                                else:
-                                    entries = [input_value]
-                                input_value = [entry.strip() for entry in entries]
-                            else:
-                                input_value = [input_value]
-                    if len(output_type) == 1:
-                        output_type = [output_type[0] for _ in input_value]
-                    elif len(output_type) == len(input_value):
-                        output_type = output_type[: len(input_value)]
-                    else:
-                        msg = f"unable to convert list of values of length {len(input_value)} to list of types of length {len(output_type)}: {input_value} -/> {output_type}"
-                        raise ValueError(msg)
-                    input_value = collection_type(
-                        to_type(input_value[index], current_type) for index, current_type in enumerate(output_type)
-                    )
-                else:
-                    input_value = collection_type()
-            elif isinstance(input_value, str):
-                input_value = json.loads(input_value.replace("'", '"'))
-
-            elif isinstance(input_value, Mapping):
-                converted_items = []
-                key_to_type = next(iter(output_type))
-                value_to_type = output_type[key_to_type]
-                for key, sub_value in input_value.items():
-                    key = to_type(key, key_to_type)
-                    converted_items.append((key, to_type(sub_value, value_to_type)))
-                input_value = collection_type(converted_items)
-            elif "pyproj" in installed_packages():
-                from pyproj import CRS
-
-                if isinstance(input_value, CRS):
-                    input_value = input_value.to_json_dict()
-        elif input_value is not None:
-            try:
-                input_value = output_type[input_value]
-            except (KeyError, ValueError):
-                try:
-                    input_value = output_type(input_value)
-                except (KeyError, ValueError) as error:
-                    msg = f'unrecognized entry "{input_value}"; must be one of {list(output_type)}'
-                    raise ValueError(msg) from error
-    elif type(input_value) is not output_type and input_value is not None:
-        if isinstance(input_value, timedelta):
-            if issubclass(output_type, str):
-                hours, remainder = divmod(input_value, timedelta(hours=1))
-                minutes, remainder = divmod(remainder, timedelta(minutes=1))
-                seconds = remainder / timedelta(seconds=1)
-                input_value = f"{hours:02}:{minutes:02}:{seconds:04.3}"
-            else:
-                input_value /= timedelta(seconds=1)
-        elif "pyproj" in installed_packages():
-            from pyproj import CRS
-
-            if isinstance(input_value, CRS):
-                if issubclass(output_type, str):
-                    input_value = input_value.to_wkt()
-                elif issubclass(output_type, dict):
-                    input_value = input_value.to_json_dict()
-                elif issubclass(output_type, int):
-                    input_value = input_value.to_epsg()
-        if issubclass(output_type, bool):
-            try:
-                input_value = ast.literal_eval(f"{input_value}")
-            except ValueError:
-                input_value = bool(input_value)
-        elif issubclass(output_type, (datetime, date)):
-            with contextlib.suppress(ModuleNotFoundError, TypeError):
-                from dateutil.parser import parse as parse_date
-
-                input_value = parse_date(input_value)
-            if issubclass(output_type, datetime) and isinstance(input_value, date) and not isinstance(input_value, datetime):
-                input_value = datetime.combine(input_value, time(0, 0, 0))
-            elif issubclass(output_type, date) and not issubclass(output_type, datetime):
-                input_value = input_value.date()
-
-        elif issubclass(output_type, timedelta):
-            if isinstance(input_value, str) and ":" in input_value:
-                parts = [float(part) for part in input_value.split(":")]
-                if len(parts) > 4:
-                    msg = f'unable to parse timedelta from input "{input_value}"'
-                    raise ValueError(msg)
-                components = {}
-                if len(parts) > 3:
-                    components["days"] = parts.pop(0)
-                if len(parts) > 2:
-                    components["hours"] = parts.pop(0)
-                components["minutes"] = parts[0]
-                components["seconds"] = parts[1]
-                input_value = timedelta(**components)
-            else:
-                input_value = timedelta(seconds=float(input_value))
-        elif "shapely" in installed_packages():
-            from shapely import wkb, wkt
-            from shapely.errors import GEOSException
-            from shapely.geometry import shape as shapely_shape
-            from shapely.geometry.base import GEOMETRY_TYPES
-
-            if output_type.__name__ in GEOMETRY_TYPES:
-                try:
-                    input_value = wkb.loads(input_value, hex=True)
-                except:
-                    try:
-                        input_value = wkt.loads(input_value)
-                    except:
-                        try:
-                            input_value = wkb.loads(input_value)
-                        except (TypeError, GEOSException):
-                            if isinstance(input_value, str):
-                                input_value = ast.literal_eval(input_value)
-                            try:
-                                input_value = shapely_shape(input_value)
-                            except:
-                                input_value = output_type(input_value)
-
-        if not isinstance(input_value, output_type):
-            if isinstance(input_value, (str, bytes)):
-                try:
-                    input_value = output_type.from_string(input_value)
-                except AttributeError:
-                    input_value = output_type(input_value)
-            else:
-                input_value = output_type(input_value)
+    Values that are already exactly of the specified (non-collection) type are passed through as-is.
+
+    :param input_values: Python values
+    :param output_type: type to convert each value to
+    :return: iterator over converted values
+
+    >>> list(to_type_many(['1', 2.5, 3], int))
+    [1, 2, 3]
+    >>> list(to_type_many([{'a': '1'}, {'b': 2}], {str: float}))
+    [{'a': 1.0}, {'b': 2.0}]
+    """
+    converter = _cached_converter(output_type)
+    if type(converter) is _ScalarPlan:
+        exact_type = converter.output_type
+        return (input_value if type(input_value) is exact_type else converter(input_value) for input_value in input_values)
+    return map(converter, input_values)
 
-    return input_value
+
+def _split_collection_string(input_value: Any) -> Collection:
+    """Interpret a single value (usually a string) as a collection of entries."""
+    if isinstance(input_value, str):
+        entries = split_collection_string(input_value)
+        if entries is not None:
+            profiling.note_branch("tokenizer")
+            return entries
+    try:
+        evaluated_value = ast.literal_eval(input_value)
+        if not isinstance(evaluated_value, Collection):
+            raise TypeError
+    except:
+        profiling.note_fallback()
+        profiling.note_branch("split")
+        if isinstance(input_value, str):
+            if "\n" in input_value:
+                entries = input_value.splitlines()
+            elif "," in input_value:
+                entries = input_value.split(",")
+            else:
+                entries = [input_value]
+            return [entry.strip() for entry in entries]
+        return [input_value]
+    else:
+        profiling.note_branch("literal_eval")
+        return evaluated_value
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
 from enum import EnumMeta
-from typing import Any, Collection, Mapping
+from functools import lru_cache
+from typing import Any, Collection, Hashable, Mapping
+
+# number of hashable type specifications (such as generic aliases) to remember in ``canonical_type()``
+TYPE_CACHE_SIZE = 1024
 
 
 def subscripted_type(generic_alias: Any) -> type:
@@ -21,32 +27,80 @@ def subscripted_type(generic_alias: Any) -> type:
     {str: ({int: str}, str)}
 
     """
-    if hasattr(generic_alias, "__origin__") and (
-        (hasattr(generic_alias.__origin__, "__name__") and generic_alias.__origin__.__name__ == "Union")
-        or (hasattr(generic_alias.__origin__, "_name") and generic_alias.__origin__._name == "Union")
-    ):
-        msg = "Union subscription is not supported"
-        raise NotImplementedError(msg)
-
-    if (
-        hasattr(generic_alias, "__origin__")
-        or isinstance(generic_alias, Collection)
-        and not isinstance(generic_alias, (EnumMeta, str))
-    ):
-        if hasattr(generic_alias, "__origin__"):
-            type_class = generic_alias.__origin__
-            if hasattr(generic_alias, "__args__"):
-                members = generic_alias.__args__
-                if issubclass(type_class, Mapping):
-                    members = [members]
-            else:
-                members = ()
-        elif isinstance(generic_alias, Collection) and not isinstance(generic_alias, (EnumMeta, str)):
-            type_class = generic_alias.__class__
-            members = generic_alias.items() if issubclass(type_class, Mapping) else generic_alias
-
-        members = [subscripted_type(member) for member in members]
-        if type_class != generic_alias.__class__ or members != generic_alias:
-            return type_class(members)
-        return generic_alias
-    return generic_alias
+    return type_from_canonical(canonical_type(generic_alias))
+
+
+def canonical_type(output_type: Any) -> Hashable:
+    """Normalize a type specification (a type, a generic alias, or a nested collection of either) to an immutable, hashable form.
+
+    Collections become ``(collection_type, members)`` tuples, where the members of mappings are ``(key, value)`` pairs;
+    equivalent specifications (such as ``List[int]`` and ``[int]``) have equal canonical forms.
+    Hashable specifications are normalized once and then retrieved from a bounded cache.
+
+    :param output_type: type specification
+    :return: canonical type
+
+    >>> from typing import Dict, List
+    >>> canonical_type(Dict[str, List[int]])
+    (<class 'dict'>, ((<class 'str'>, (<class 'list'>, (<class 'int'>,))),))
+    >>> canonical_type({str: [int]}) == canonical_type(Dict[str, List[int]])
+    True
+    """
+    if type(output_type) is type:
+        return output_type
+    if type(output_type) in (list, dict, set):
+        # literal collections such as `[int]` are unhashable; their members are still normalized through the cache
+        return _canonical_type(output_type)
+    try:
+        return _cached_canonical_type(output_type)
+    except TypeError:
+        # other unhashable specifications
+        return _canonical_type(output_type)
+
+
+def type_from_canonical(canonical: Hashable) -> Any:
+    """Build a subscripted type (see ``subscripted_type()``) from its canonical form (see ``canonical_type()``).
+
+    :param canonical: canonical type
+    :return: simple type
+
+    >>> type_from_canonical((dict, ((str, (list, (int,))),)))
+    {str: [int]}
+    """
+    if isinstance(canonical, tuple):
+        collection_type, members = canonical
+        if issubclass(collection_type, Mapping):
+            return collection_type([(type_from_canonical(key), type_from_canonical(value)) for key, value in members])
+        return collection_type([type_from_canonical(member) for member in members])
+    return canonical
+
+
+def _canonical_type(output_type: Any) -> Hashable:
+    if hasattr(output_type, "__origin__"):
+        collection_type = output_type.__origin__
+        if (hasattr(collection_type, "__name__") and collection_type.__name__ == "Union") or (
+            hasattr(collection_type, "_name") and collection_type._name == "Union"
+        ):
+            msg = "Union subscription is not supported"
+            raise NotImplementedError(msg)
+
+        if hasattr(output_type, "__args__"):
+            members = output_type.__args__
+            if issubclass(collection_type, Mapping):
+                members = [members]
+        else:
+            members = ()
+    elif isinstance(output_type, Collection) and not isinstance(output_type, (EnumMeta, str)):
+        collection_type = output_type.__class__
+        members = output_type.items() if issubclass(collection_type, Mapping) else output_type
+    else:
+        return output_type
+
+    if issubclass(collection_type, Mapping):
+        members = tuple((canonical_type(key), canonical_type(value)) for key, value in members)
+    else:
+        members = tuple(canonical_type(member) for member in members)
+    return collection_type, members
+
+
+_cached_canonical_type = lru_cache(maxsize=TYPE_CACHE_SIZE)(_canonical_type)